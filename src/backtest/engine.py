@@ -6,24 +6,22 @@ conservative and does not attempt to model multi-candle position management.
 """
 from __future__ import annotations
 
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
-from typing import Iterable
 
-import pandas as pd
+import numpy as np
 from loguru import logger
 
 from config.settings import Settings
-from data.btc_state import detect_btc_state
-from execution.paper import simulate_trade
-from market.quality import market_quality_score
-from market.regime import detect_regime
-from risk.adaptive import AdaptiveState, adjust_risk
-from risk.sizing import position_size
-from risk.stops import atr_stops
+from data.btc_state import btc_state_series
+from execution.paper import simulate_trades
+from market.quality import market_quality_series
+from market.regime import regime_series
+from risk.stops import atr_stops_arrays
 from storage.repo import SQLiteRepository
 from strategy.breakout_donchian import BreakoutDonchianStrategy
-from strategy.ensemble import ensemble
-from strategy.indicators import atr
+from strategy.ensemble import ensemble_series, precompute_strategy_signals
+from strategy.indicators import IndicatorBundle
 from strategy.mean_reversion_bb import MeanReversionBBStrategy
 from strategy.trend_ema import TrendEmaStrategy
 
@@ -61,27 +59,13 @@ class BacktestResult:
     trades: list[BacktestTrade]
 
 
-def _rows_to_df(rows: Iterable[object]) -> pd.DataFrame:
-    if not rows:
-        return pd.DataFrame()
-    df = pd.DataFrame([dict(row) for row in rows])
-    return df.sort_values("open_time_ms").reset_index(drop=True)
-
-
-def _calculate_drawdown(pnls: list[float]) -> float:
-    if not pnls:
+def _calculate_drawdown(cumulative: np.ndarray) -> float:
+    """Largest peak-to-trough drop of a cumulative pnl curve."""
+    if len(cumulative) == 0:
         return 0.0
-    cumulative = []
-    running = 0.0
-    for pnl in pnls:
-        running += pnl
-        cumulative.append(running)
-    peak = cumulative[0]
-    max_dd = 0.0
-    for value in cumulative:
-        peak = max(peak, value)
-        max_dd = min(max_dd, value - peak)
-    return float(abs(max_dd))
+    drawdown = np.maximum.accumulate(cumulative)
+    np.subtract(drawdown, cumulative, out=drawdown)
+    return float(drawdown.max())
 
 
 def run_backtest(
@@ -94,8 +78,7 @@ def run_backtest(
     min_window: int = 100,
 ) -> BacktestResult:
     """Run a simple single-candle backtest over stored candle data."""
-    rows = repo.fetch_candles(symbol, timeframe, limit=limit)
-    df = _rows_to_df(rows)
+    df = repo.fetch_candles_frame(symbol, timeframe, limit=limit)
     if df.empty or len(df) < min_window:
         logger.warning("backtest_empty symbol={} timeframe={} rows={}", symbol, timeframe, len(df))
         return BacktestResult(
@@ -109,89 +92,125 @@ def run_backtest(
             trades=[],
         )
 
-    btc_rows = repo.fetch_candles("BTC/USDT", timeframe, limit=limit)
-    btc_df = _rows_to_df(btc_rows)
+    # btc_df is only read below, so the symbol's own frame can stand in without a copy.
+    btc_df = (
+        df
+        if symbol == "BTC/USDT"
+        else repo.fetch_candles_frame("BTC/USDT", timeframe, limit=limit)
+    )
     if btc_df.empty:
-        btc_df = df.copy()
+        btc_df = df
 
     strategies = [
         TrendEmaStrategy(),
         BreakoutDonchianStrategy(),
         MeanReversionBBStrategy(),
     ]
-    adaptive_state = AdaptiveState()
-
-    trades: list[BacktestTrade] = []
-    for idx in range(min_window, len(df)):
-        window = df.iloc[: idx + 1]
-        last_time = int(window.iloc[-1]["open_time_ms"])
-        btc_window = btc_df[btc_df["open_time_ms"] <= last_time]
-        if btc_window.empty:
-            btc_window = window
-
-        regime = detect_regime(window)
-        btc_state = detect_btc_state(btc_window, settings.btc_state)
-        quality = market_quality_score(window, 0.001, 1e8, settings.market_quality)
-        decision = ensemble(
-            symbol,
-            window,
-            strategies,
-            regime.regime,
-            btc_state.state,
-            quality.score,
-            settings,
-        )
-        if decision.signal.direction == "NONE":
-            continue
-
-        atr_value = float(atr(window, 14).iloc[-1])
-        stops = atr_stops(
-            entry=float(decision.signal.price),
-            atr_value=atr_value,
-            direction=decision.signal.direction,
-            stop_mult=settings.risk.stop_atr_mult,
-            take_mult=settings.risk.take_atr_mult,
-        )
-        risk_pct = adjust_risk(settings.risk.risk_per_trade_pct, adaptive_state)
-        position_size(1000.0, risk_pct, decision.signal.price, stops.stop)
-
-        candle = window.iloc[-1]
-        trade_result = simulate_trade(
-            decision.signal.direction,
-            float(decision.signal.price),
-            stops.stop,
-            stops.take,
-            candle_high=float(candle["high"]),
-            candle_low=float(candle["low"]),
-            fee_rate=settings.risk.fee_rate,
-            worst_case_same_candle=settings.execution.worst_case_same_candle,
-        )
-        trades.append(
-            BacktestTrade(
-                time_ms=int(candle["close_time_ms"]),
-                symbol=symbol,
-                direction=decision.signal.direction,
-                entry_price=float(decision.signal.price),
-                stop_price=stops.stop,
-                take_price=stops.take,
-                status=trade_result.status,
-                pnl_pct=trade_result.pnl_pct,
-            )
-        )
-
-    closed_trades = [trade for trade in trades if trade.pnl_pct is not None]
-    wins = [trade for trade in closed_trades if trade.pnl_pct and trade.pnl_pct > 0]
-    winrate = float(len(wins) / len(closed_trades)) if closed_trades else 0.0
-    expectancy = float(
-        sum(trade.pnl_pct for trade in closed_trades if trade.pnl_pct is not None) / len(closed_trades)
-    ) if closed_trades else 0.0
-    drawdown = _calculate_drawdown([trade.pnl_pct or 0.0 for trade in closed_trades])
 
+    # Regime and quality only depend on past candles, so one full-length pass
+    # yields the same per-candle values as re-evaluating every growing window.
+    bundle = IndicatorBundle(df)
+    regimes = regime_series(df, bundle).to_numpy()
+    qualities = market_quality_series(df, 0.001, 1e8, settings.market_quality, bundle).to_numpy()
+    atr_values = bundle.atr14.to_numpy()
+
+    # Align each candle with the BTC state of the latest BTC candle at or before it,
+    # falling back to the symbol's own candles when BTC history does not reach back.
+    btc_end = np.searchsorted(
+        btc_df["open_time_ms"].to_numpy(), df["open_time_ms"].to_numpy(), side="right"
+    )
+    btc_bundle = bundle if btc_df is df else IndicatorBundle(btc_df)
+    btc_states = btc_state_series(btc_df, settings.btc_state, btc_bundle).to_numpy()
+    btc_states = btc_states[np.maximum(btc_end - 1, 0)]
+    if (btc_end == 0).any():
+        own_states = btc_state_series(df, settings.btc_state, bundle).to_numpy()
+        btc_states = np.where(btc_end > 0, btc_states, own_states)
+
+    signals = precompute_strategy_signals(df, strategies, settings, bundle)
+    close_times = df["close_time_ms"].to_numpy(dtype=np.int64)
+
+    # Every step is a per-row mask, so the whole history is decided at once
+    # and only candles past the warm-up window become trades.
+    decisions = ensemble_series(signals, strategies, regimes, btc_states, qualities, settings)
+    rows = np.flatnonzero(decisions[min_window:] != "NONE") + min_window
+    directions = decisions[rows]
+    count = len(rows)
+    entries = df["close"].to_numpy(dtype=np.float64)[rows]
+    trade_stops, trade_takes = atr_stops_arrays(
+        entries,
+        atr_values[rows],
+        directions == "LONG",
+        settings.risk.stop_atr_mult,
+        settings.risk.take_atr_mult,
+    )
+    statuses, _exit_prices, pnls = simulate_trades(
+        directions,
+        entries,
+        trade_stops,
+        trade_takes,
+        df["high"].to_numpy(dtype=np.float64)[rows],
+        df["low"].to_numpy(dtype=np.float64)[rows],
+        worst_case_same_candle=settings.execution.worst_case_same_candle,
+    )
+    closed_pnls = pnls[~np.isnan(pnls)]
+    closed_count = len(closed_pnls)
+    # One cumulative pass feeds both the expectancy (its last value) and the drawdown.
+    cumulative = np.cumsum(closed_pnls)
     summary = BacktestSummary(
-        total_trades=len(trades),
-        closed_trades=len(closed_trades),
-        winrate=winrate,
-        expectancy=expectancy,
-        max_drawdown=drawdown,
+        total_trades=count,
+        closed_trades=closed_count,
+        winrate=float(np.count_nonzero(closed_pnls > 0) / closed_count) if closed_count else 0.0,
+        expectancy=float(cumulative[-1] / closed_count) if closed_count else 0.0,
+        max_drawdown=_calculate_drawdown(cumulative),
     )
+    trades = [
+        BacktestTrade(
+            time_ms=int(close_times[rows[i]]),
+            symbol=symbol,
+            direction=str(directions[i]),
+            entry_price=float(entries[i]),
+            stop_price=float(trade_stops[i]),
+            take_price=float(trade_takes[i]),
+            status=str(statuses[i]),
+            pnl_pct=None if np.isnan(pnls[i]) else float(pnls[i]),
+        )
+        for i in range(count)
+    ]
     return BacktestResult(summary=summary, trades=trades)
+
+
+def _run_backtest_worker(
+    symbol: str,
+    timeframe: str,
+    settings: Settings,
+    limit: int,
+    min_window: int,
+) -> BacktestResult:
+    # SQLite connections cannot cross process boundaries, so each worker opens its own.
+    repo = SQLiteRepository(str(settings.db_path))
+    try:
+        return run_backtest(
+            symbol, timeframe, settings=settings, repo=repo, limit=limit, min_window=min_window
+        )
+    finally:
+        repo.close()
+
+
+def run_backtests(
+    symbols: list[str],
+    timeframe: str,
+    *,
+    settings: Settings,
+    limit: int = 1000,
+    min_window: int = 100,
+    max_workers: int | None = None,
+) -> dict[str, BacktestResult]:
+    """Backtest several symbols in parallel worker processes, keyed by symbol."""
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        futures = {
+            symbol: pool.submit(
+                _run_backtest_worker, symbol, timeframe, settings, limit, min_window
+            )
+            for symbol in symbols
+        }
+        return {symbol: future.result() for symbol, future in futures.items()}
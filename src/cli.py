@@ -2,11 +2,13 @@
 from __future__ import annotations
 
 import argparse
+import sys
 from datetime import datetime
 
+import numpy as np
 import pandas as pd
 
-from backtest.engine import run_backtest
+from backtest.engine import BacktestSummary, run_backtest, run_backtests
 from config.settings import Settings
 from storage.repo import SQLiteRepository
 from observability.report import generate_daily_report
@@ -14,43 +16,65 @@ from runner import TradingRunner, run_live
 
 
 def _dummy_df() -> pd.DataFrame:
+    candles = 60
+    steps = np.arange(candles, dtype=np.float64)
+    prices = 100 + steps * 0.1
     data = {
-        "open_time_ms": list(range(0, 60 * 15 * 1000 * 60, 15 * 60 * 1000)),
-        "open": [100 + i * 0.1 for i in range(60)],
-        "high": [100 + i * 0.12 for i in range(60)],
-        "low": [100 + i * 0.08 for i in range(60)],
-        "close": [100 + i * 0.1 for i in range(60)],
-        "volume": [1000] * 60,
+        "open_time_ms": np.arange(candles, dtype=np.int64) * (15 * 60 * 1000),
+        "open": prices,
+        "high": 100 + steps * 0.12,
+        "low": 100 + steps * 0.08,
+        "close": prices,
+        "volume": np.full(candles, 1000, dtype=np.int64),
     }
     return pd.DataFrame(data)
 
 
-def run_command(_: argparse.Namespace) -> None:
-    settings = Settings.load()
-    runner = TradingRunner(settings)
+def run_command(args: argparse.Namespace) -> None:
+    runner = TradingRunner(args.settings)
     df = _dummy_df()
     runner.run_once("BTC/USDT", df, df)
 
 
-def backtest_command(args: argparse.Namespace) -> None:
-    settings = Settings.load()
-    repo = SQLiteRepository(str(settings.db_path))
-    result = run_backtest(
-        symbol=args.symbol,
-        timeframe=args.timeframe,
-        settings=settings,
-        repo=repo,
-        limit=args.limit,
-        min_window=args.min_window,
-    )
-    summary = result.summary
+def _print_backtest_summary(symbol: str, timeframe: str, summary: BacktestSummary) -> None:
     print(
-        f"Backtest {args.symbol} {args.timeframe} | trades={summary.total_trades} "
+        f"Backtest {symbol} {timeframe} | trades={summary.total_trades} "
         f"closed={summary.closed_trades} winrate={summary.winrate:.2%} "
         f"expectancy={summary.expectancy:.4f} max_dd={summary.max_drawdown:.4f}"
     )
 
 
+def backtest_command(args: argparse.Namespace) -> None:
+    settings = args.settings
+    symbols = _parse_symbols(args.symbols)
+    if symbols:
+        results = run_backtests(
+            symbols,
+            args.timeframe,
+            settings=settings,
+            limit=args.limit,
+            min_window=args.min_window,
+            max_workers=args.workers,
+        )
+        for symbol, result in results.items():
+            _print_backtest_summary(symbol, args.timeframe, result.summary)
+        return
+
+    repo = SQLiteRepository(str(settings.db_path))
+    try:
+        result = run_backtest(
+            symbol=args.symbol,
+            timeframe=args.timeframe,
+            settings=settings,
+            repo=repo,
+            limit=args.limit,
+            min_window=args.min_window,
+        )
+    finally:
+        repo.close()
+    _print_backtest_summary(args.symbol, args.timeframe, result.summary)
+
+
 def report_command(_: argparse.Namespace) -> None:
     report = generate_daily_report({"trades": 0}, {"strategies": []})
     print(report)
@@ -67,24 +91,26 @@ def healthcheck_command(_: argparse.Namespace) -> None:
 def _parse_symbols(raw: str | None) -> list[str] | None:
     if not raw:
         return None
-    return [symbol.strip() for symbol in raw.split(",") if symbol.strip()]
+    # Interned so the per-symbol dict lookups downstream compare by identity first.
+    return [sys.intern(symbol.strip()) for symbol in raw.split(",") if symbol.strip()]
 
 
 def run_live_command(args: argparse.Namespace) -> None:
-    settings = Settings.load()
     run_live(
         symbols=_parse_symbols(args.symbols),
         max_symbols=args.max_symbols,
         once=args.once,
         loop_seconds=args.loop_seconds,
         timeframe=args.timeframe,
-        settings=settings,
+        settings=args.settings,
     )
 
 
 def main() -> None:
     settings = Settings.load()
     parser = argparse.ArgumentParser(description="TOB trading platform")
+    # Parse the YAML config once and hand the same Settings to whichever command runs.
+    parser.set_defaults(settings=settings)
     sub = parser.add_subparsers(dest="command", required=True)
 
     sub.add_parser("run")
@@ -93,6 +119,14 @@ def main() -> None:
     backtest_parser.add_argument("--timeframe", default=settings.live.timeframe)
     backtest_parser.add_argument("--limit", type=int, default=1000)
     backtest_parser.add_argument("--min-window", type=int, default=100)
+    backtest_parser.add_argument(
+        "--symbols",
+        help="Symbols CSV to backtest in parallel, e.g. BTC/USDT,ETH/USDT",
+        default=None,
+    )
+    backtest_parser.add_argument(
+        "--workers", type=int, default=None, help="Worker processes (default: CPUs)"
+    )
     sub.add_parser("report")
     sub.add_parser("universe")
     sub.add_parser("healthcheck")
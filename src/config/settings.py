@@ -1,6 +1,7 @@
 """Application configuration using Pydantic Settings."""
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 from typing import List
 
@@ -8,9 +9,30 @@ import yaml
 from pydantic import BaseModel, Field
 from pydantic_settings import BaseSettings
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader
+
 DEFAULTS_PATH = Path(__file__).with_name("defaults.yaml")
 
 
+@lru_cache(maxsize=16)
+def _parse_yaml(path: str, mtime_ns: int, size: int) -> dict:
+    return yaml.load(Path(path).read_text(), Loader=_SafeLoader) or {}
+
+
+def read_yaml(path: Path) -> dict:
+    """Parse a YAML file, reusing the previous parse while mtime and size are unchanged.
+
+    The returned dict is shared between callers and must not be mutated.
+    """
+    if not path.exists():
+        return {}
+    stat = path.stat()
+    return _parse_yaml(str(path), stat.st_mtime_ns, stat.st_size)
+
+
 class RiskSettings(BaseModel):
     risk_per_trade_pct: float = 0.005
     max_daily_loss_r: float = 3.0
@@ -98,6 +120,7 @@ class LiveSettings(BaseModel):
     loop_seconds: int = 30
     timeframe: str = "15m"
     candle_limit: int = 300
+    use_websocket: bool = False
 
 
 class Settings(BaseSettings):
@@ -130,8 +153,7 @@ class Settings(BaseSettings):
     @classmethod
     def load(cls, config_path: Path | None = None) -> "Settings":
         config_data: dict = {}
-        if DEFAULTS_PATH.exists():
-            config_data.update(yaml.safe_load(DEFAULTS_PATH.read_text()) or {})
-        if config_path and config_path.exists():
-            config_data.update(yaml.safe_load(config_path.read_text()) or {})
+        config_data.update(read_yaml(DEFAULTS_PATH))
+        if config_path:
+            config_data.update(read_yaml(config_path))
         return cls(**config_data)
@@ -3,9 +3,10 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+import numpy as np
 import pandas as pd
 
-from strategy.indicators import atr, bb_width, ema
+from strategy.indicators import IndicatorBundle
 
 
 @dataclass
@@ -14,13 +15,16 @@ class BtcStateResult:
     meta: dict
 
 
-def detect_btc_state(df: pd.DataFrame, settings: object) -> BtcStateResult:
+def detect_btc_state(
+    df: pd.DataFrame, settings: object, bundle: IndicatorBundle | None = None
+) -> BtcStateResult:
     """Detect BTC state based on ATR/BB width and trend slope."""
-    atr_val = atr(df, period=14).iloc[-1]
-    atr_pct = atr_val / df["close"].iloc[-1]
-    width = bb_width(df, period=20, std=2.0).iloc[-1]
-    ema50 = ema(df["close"], period=50)
-    slope = (ema50.iloc[-1] - ema50.iloc[-5]) / ema50.iloc[-5]
+    if bundle is None:
+        bundle = IndicatorBundle(df)
+    atr_pct = bundle.atr_pct.to_numpy()[-1]
+    width = bundle.bb_width20.to_numpy()[-1]
+    ema50 = bundle.ema50.to_numpy()
+    slope = (ema50[-1] - ema50[-5]) / ema50[-5]
 
     if atr_pct <= settings.squeeze_atr_pct and width <= settings.squeeze_bb_width:
         return BtcStateResult("SQUEEZE", {"atr_pct": atr_pct, "bb_width": width})
@@ -30,3 +34,27 @@ def detect_btc_state(df: pd.DataFrame, settings: object) -> BtcStateResult:
         return BtcStateResult("EXPANDING_DOWN", {"atr_pct": atr_pct, "slope": slope})
     return BtcStateResult("CHOP", {"atr_pct": atr_pct, "slope": slope})
 
+
+def btc_state_series(
+    df: pd.DataFrame, settings: object, bundle: IndicatorBundle | None = None
+) -> pd.Series:
+    """BTC state for every row, equivalent to ``detect_btc_state(df.iloc[: i + 1])``."""
+    if bundle is None:
+        bundle = IndicatorBundle(df)
+    atr_pct = bundle.atr_pct
+    width = bundle.bb_width20
+    ema50 = bundle.ema50
+    prev = ema50.shift(4)
+    slope = (ema50 - prev) / prev
+
+    expanding = atr_pct >= settings.expanding_atr_pct
+    states = np.select(
+        [
+            (atr_pct <= settings.squeeze_atr_pct) & (width <= settings.squeeze_bb_width),
+            expanding & (slope >= settings.trend_slope),
+            expanding & (slope <= -settings.trend_slope),
+        ],
+        ["SQUEEZE", "EXPANDING_UP", "EXPANDING_DOWN"],
+        default="CHOP",
+    )
+    return pd.Series(states, index=df.index)
@@ -1,9 +1,8 @@
 """Data collection and persistence."""
 from __future__ import annotations
 
-from typing import Any
+from functools import lru_cache
 
-import pandas as pd
 from loguru import logger
 
 from exchange.base import ExchangeClient
@@ -19,6 +18,7 @@ class CandleCollector:
         self.exchange_name = exchange_name
 
     @staticmethod
+    @lru_cache(maxsize=32)
     def _timeframe_to_ms(timeframe: str) -> int:
         unit = timeframe[-1]
         value = int(timeframe[:-1])
@@ -33,22 +33,46 @@ class CandleCollector:
     def sync_candles(self, symbol: str, timeframe: str, limit: int = 300) -> int:
         """Fetch candles and upsert into SQLite. Returns number of new candles."""
         raw = self.exchange.fetch_ohlcv(symbol, timeframe=timeframe, limit=limit)
+        return self.store_candles(symbol, timeframe, raw)
+
+    def sync_candles_batch(
+        self, symbols: list[str], timeframe: str, limit: int = 300
+    ) -> dict[str, int]:
+        """Fetch candles for many symbols concurrently and upsert them.
+
+        Returns new counts per symbol.
+        """
+        raw_by_symbol = self.exchange.fetch_ohlcv_batch(symbols, timeframe=timeframe, limit=limit)
+        # SQLite writes stay on this thread; only the network calls run in parallel.
+        return {
+            symbol: self.store_candles(symbol, timeframe, raw_by_symbol.get(symbol, []))
+            for symbol in symbols
+        }
+
+    def store_candles(self, symbol: str, timeframe: str, raw: list[list[float]]) -> int:
+        """Upsert raw OHLCV rows (e.g. from a websocket feed). Returns number of new candles."""
         if not raw:
             logger.warning("no_candles_fetched symbol={} timeframe={}", symbol, timeframe)
             return 0
 
-        df = pd.DataFrame(raw, columns=["open_time_ms", "open", "high", "low", "close", "volume"])
-        close_delta = self._timeframe_to_ms(timeframe)
-        df["close_time_ms"] = df["open_time_ms"] + close_delta
-        rows: list[dict[str, Any]] = df.to_dict(orient="records")
-
         last_open_time = self.repo.fetch_latest_candle_open_time(
             self.exchange_name,
             symbol,
             timeframe,
         )
-        new_count = len(df) if last_open_time is None else int((df["open_time_ms"] > last_open_time).sum())
-        self.repo.upsert_candles(self.exchange_name, symbol, timeframe, rows)
+        new_count = (
+            len(raw)
+            if last_open_time is None
+            else sum(1 for row in raw if row[0] > last_open_time)
+        )
+        # The raw rows are bound as-is; no DataFrame or column arrays in between.
+        self.repo.upsert_ohlcv(
+            self.exchange_name,
+            symbol,
+            timeframe,
+            raw,
+            self._timeframe_to_ms(timeframe),
+        )
         return new_count
 
     def latest_closed_candle_open_time(self, symbol: str, timeframe: str) -> int | None:
@@ -2,14 +2,14 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Iterable
+from typing import Any, Iterable, NamedTuple
 
 import numpy as np
 import pandas as pd
 from loguru import logger
 
 from exchange.base import ExchangeClient
-from strategy.indicators import atr
+from strategy.indicators import atr_array
 
 
 @dataclass
@@ -25,18 +25,103 @@ def _normalize(series: pd.Series) -> pd.Series:
     return (series - series.min()) / (series.max() - series.min())
 
 
-def compute_beta(returns: pd.Series, btc_returns: pd.Series) -> float:
-    cov = np.cov(returns, btc_returns)[0][1]
-    var = np.var(btc_returns)
-    if var == 0:
-        return 0.0
-    return float(cov / var)
-
-
-def compute_corr(returns: pd.Series, btc_returns: pd.Series) -> float:
-    if returns.empty or btc_returns.empty:
-        return 0.0
-    return float(np.corrcoef(returns, btc_returns)[0][1])
+def _log_returns(close: np.ndarray) -> np.ndarray:
+    """Candle-to-candle log returns, skipping gaps (NaN) like ``diff().dropna()``."""
+    returns = np.diff(np.log(close))
+    return returns[~np.isnan(returns)]
+
+
+class _BtcStats(NamedTuple):
+    """BTC returns minus their mean, and their sum of squares."""
+
+    centered: np.ndarray
+    sum_sq: float
+
+
+def _btc_stats(btc_returns: pd.Series | np.ndarray) -> _BtcStats:
+    y = np.asarray(btc_returns, dtype=np.float64)
+    centered = y - y.mean() if len(y) else y
+    return _BtcStats(centered, float(centered @ centered))
+
+
+def _beta_corr_from_stats(returns: pd.Series | np.ndarray, btc: _BtcStats) -> tuple[float, float]:
+    if len(returns) < 2 or len(btc.centered) < 2:
+        return 0.0, 0.0
+    x = np.asarray(returns, dtype=np.float64)
+    dx = x - x.mean()
+    sxy = float(dx @ btc.centered)
+    syy = btc.sum_sq
+    n = len(x)
+    # Sample covariance over population variance, as the original np.cov / np.var.
+    beta = sxy / syy * n / (n - 1) if syy else 0.0
+    denom = np.sqrt(float(dx @ dx) * syy)
+    corr = sxy / denom if denom else 0.0
+    return beta, float(corr)
+
+
+def compute_beta_corr(
+    returns: pd.Series | np.ndarray, btc_returns: pd.Series | np.ndarray
+) -> tuple[float, float]:
+    """Beta and correlation of ``returns`` against BTC from one set of sums."""
+    return _beta_corr_from_stats(returns, _btc_stats(btc_returns))
+
+
+def _compute_betas_corrs_batch(
+    btc: _BtcStats, returns: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """:func:`compute_beta_corr` for every row of an ``(N, T)`` matrix aligned with BTC.
+
+    All covariances come from a single matrix-vector product. All-zero rows
+    (e.g. placeholders) get 0.0 for both.
+    """
+    betas = np.zeros(len(returns))
+    corrs = np.zeros(len(returns))
+    dy, syy = btc
+    if len(returns) and len(dy) >= 2 and syy:
+        centered = returns - returns.mean(axis=1, keepdims=True)
+        sxy = centered @ dy
+        sxx = np.einsum("ij,ij->i", centered, centered)
+        n = len(dy)
+        betas[:] = sxy / syy * n / (n - 1)
+        denom = np.sqrt(sxx * syy)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            corrs[:] = np.where(denom > 0, sxy / denom, 0.0)
+    return betas, corrs
+
+
+def compute_beta(returns: pd.Series | np.ndarray, btc_returns: pd.Series | np.ndarray) -> float:
+    return compute_beta_corr(returns, btc_returns)[0]
+
+
+def compute_corr(returns: pd.Series | np.ndarray, btc_returns: pd.Series | np.ndarray) -> float:
+    return compute_beta_corr(returns, btc_returns)[1]
+
+
+def _quantile(values: np.ndarray, q: float) -> float:
+    """Linear-interpolated quantile ignoring NaN, as ``Series.quantile``, via O(N) selection."""
+    values = values[~np.isnan(values)]
+    if values.size == 0:
+        return float("nan")
+    position = (values.size - 1) * q
+    lower = int(np.floor(position))
+    upper = min(lower + 1, values.size - 1)
+    # Only the two ranks around the quantile need to be in place; no full sort.
+    selected = np.partition(values, [lower, upper])
+    low, high = float(selected[lower]), float(selected[upper])
+    return low + (high - low) * (position - lower)
+
+
+def _top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """Positions of the ``k`` highest scores, best first; NaN scores rank last."""
+    k = min(k, len(scores))
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+    keys = np.where(np.isnan(scores), -np.inf, scores)
+    if k == 1:
+        return np.array([keys.argmax()])
+    # argpartition is O(N); only the k survivors get sorted.
+    top = np.argpartition(-keys, k - 1)[:k]
+    return top[np.argsort(-keys[top], kind="stable")]
 
 
 class UniverseBuilder:
@@ -55,39 +140,68 @@ class UniverseBuilder:
         if settings.manual_override:
             return UniverseResult(symbols=settings.manual_override, scores={}, meta={"override": True})
 
-        btc_returns = np.log(btc_candles["close"]).diff().dropna()
-        records: list[dict[str, Any]] = []
-        for symbol, df in symbol_candles.items():
-            atr_val = atr(df, period=14).iloc[-1]
-            atr_pct = atr_val / df["close"].iloc[-1]
-            returns = np.log(df["close"]).diff().dropna()
-            beta = compute_beta(returns, btc_returns)
-            corr = compute_corr(returns, btc_returns)
-            volume = tickers.get(symbol, {}).get("quoteVolume", 0)
-            records.append(
-                {
-                    "symbol": symbol,
-                    "volume": volume,
-                    "atr_pct": atr_pct,
-                    "beta": beta,
-                    "corr": corr,
-                }
+        if not symbol_candles:
+            return UniverseResult(symbols=[], scores={}, meta={"reason": "no_data"})
+
+        # BTC's centred returns are shared by every candidate's beta and correlation.
+        btc_returns = _log_returns(btc_candles["close"].to_numpy(dtype=np.float64))
+        btc = _btc_stats(btc_returns)
+        symbols = list(symbol_candles)
+        atr_pcts = np.empty(len(symbols))
+        # Returns aligned with BTC's go straight into one contiguous (N, T) matrix;
+        # the rare series of another length (gaps, new listings) is compared with
+        # BTC over their common trailing window instead.
+        returns = np.zeros((len(symbols), len(btc.centered)))
+        ragged: dict[int, np.ndarray] = {}
+        for i, df in enumerate(symbol_candles.values()):
+            # Pull the columns out once; everything below is plain numpy.
+            close = df["close"].to_numpy(dtype=np.float64)
+            high = df["high"].to_numpy(dtype=np.float64)
+            low = df["low"].to_numpy(dtype=np.float64)
+            atr_pcts[i] = atr_array(high, low, close, 14)[-1] / close[-1]
+            symbol_returns = _log_returns(close)
+            if len(symbol_returns) == returns.shape[1]:
+                returns[i] = symbol_returns
+            else:
+                ragged[i] = symbol_returns
+        betas, corrs = _compute_betas_corrs_batch(btc, returns)
+        for i, symbol_returns in ragged.items():
+            overlap = min(len(symbol_returns), len(btc_returns))
+            logger.debug(
+                "universe_returns_ragged symbol={} length={} overlap={}",
+                symbols[i],
+                len(symbol_returns),
+                overlap,
+            )
+            betas[i], corrs[i] = compute_beta_corr(
+                symbol_returns[len(symbol_returns) - overlap :],
+                btc_returns[len(btc_returns) - overlap :],
             )
 
-        data = pd.DataFrame(records).set_index("symbol")
-        if data.empty:
-            return UniverseResult(symbols=[], scores={}, meta={"reason": "no_data"})
+        data = pd.DataFrame(
+            {
+                "volume": [tickers.get(symbol, {}).get("quoteVolume", 0) for symbol in symbols],
+                "atr_pct": atr_pcts,
+                "beta": betas,
+                "corr": corrs,
+            },
+            index=pd.Index(symbols, name="symbol"),
+        )
 
         volume_unavailable = data["volume"].sum() == 0
         if volume_unavailable:
             logger.warning("volume_unavailable_fallback")
             filtered = data.copy()
         else:
-            volume_threshold = data["volume"].quantile(1 - settings.volume_percentile)
+            volumes = data["volume"].to_numpy(dtype=np.float64)
+            volume_threshold = _quantile(volumes, 1 - settings.volume_percentile)
             filtered = data[data["volume"] >= volume_threshold]
-        filtered = filtered[filtered["atr_pct"] >= settings.min_atr_pct]
-        filtered = filtered[filtered["beta"] >= settings.min_beta_btc]
-        filtered = filtered[filtered["corr"] >= settings.min_corr_btc]
+        # One combined mask instead of three successive filtered copies.
+        filtered = filtered[
+            (filtered["atr_pct"].to_numpy() >= settings.min_atr_pct)
+            & (filtered["beta"].to_numpy() >= settings.min_beta_btc)
+            & (filtered["corr"].to_numpy() >= settings.min_corr_btc)
+        ]
         if filtered.empty:
             return UniverseResult(symbols=[], scores={}, meta={"reason": "filtered_empty"})
 
@@ -96,14 +210,16 @@ class UniverseBuilder:
             if not volume_unavailable
             else pd.Series(0.0, index=filtered.index)
         )
+        weights = settings.weights
         scores = (
-            settings.weights.volume * volume_score
-            + settings.weights.atr_pct * _normalize(filtered["atr_pct"])
-            + settings.weights.beta * _normalize(filtered["beta"])
+            weights.volume * volume_score
+            + weights.atr_pct * _normalize(filtered["atr_pct"])
+            + weights.beta * _normalize(filtered["beta"])
         )
-        ranked = scores.sort_values(ascending=False).head(settings.max_symbols)
+        top = _top_k(scores.to_numpy(dtype=np.float64), settings.max_symbols)
+        symbols = scores.index[top].tolist()
         return UniverseResult(
-            symbols=list(ranked.index),
-            scores=ranked.to_dict(),
+            symbols=symbols,
+            scores=dict(zip(symbols, scores.to_numpy()[top].tolist())),
             meta={"candidates": len(filtered), "volume_unavailable": volume_unavailable},
         )
@@ -12,6 +12,12 @@ class ExchangeClient(ABC):
     def fetch_ohlcv(self, symbol: str, timeframe: str, limit: int = 300) -> list[list[float]]:
         raise NotImplementedError
 
+    def fetch_ohlcv_batch(
+        self, symbols: Iterable[str], timeframe: str, limit: int = 300
+    ) -> dict[str, list[list[float]]]:
+        """Fetch candles for several symbols, keyed by symbol."""
+        return {symbol: self.fetch_ohlcv(symbol, timeframe, limit=limit) for symbol in symbols}
+
     @abstractmethod
     def fetch_tickers(self) -> dict[str, Any]:
         raise NotImplementedError
@@ -24,6 +30,13 @@ class ExchangeClient(ABC):
     def create_order(self, symbol: str, side: str, amount: float, price: float | None) -> Any:
         raise NotImplementedError
 
+    def create_orders(self, orders: list[dict[str, Any]]) -> list[Any]:
+        """Submit several orders given as ``{symbol, side, amount, price}`` dicts."""
+        return [
+            self.create_order(order["symbol"], order["side"], order["amount"], order.get("price"))
+            for order in orders
+        ]
+
     @abstractmethod
     def set_leverage(self, symbol: str, leverage: int) -> None:
         raise NotImplementedError
@@ -1,27 +1,62 @@
 """Binance USDⓈ-M futures client via CCXT."""
 from __future__ import annotations
 
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Any, Iterable
 
 import ccxt
 from loguru import logger
 
 from exchange.base import ExchangeClient
-from exchange.rate_limit import RateLimitGuard
+from exchange.cache import ttl_cached
+from exchange.rate_limit import RateLimitGuard, parse_retry_after, state_path_for
 
+_local = threading.local()
+# One pool for the whole process; its threads only start on the first batch.
+_ohlcv_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="binance-ohlcv")
 
-class BinanceFuturesClient(ExchangeClient):
-    """CCXT wrapper for Binance USDⓈ-M futures."""
 
-    def __init__(self, api_key: str | None = None, api_secret: str | None = None) -> None:
-        self.client = ccxt.binanceusdm({
+def _thread_client(key: str, api_key: str | None, api_secret: str | None) -> ccxt.binanceusdm:
+    # ccxt keeps its HTTP session, loaded markets and last response headers per
+    # instance, so each thread reuses one per key instead of sharing it.
+    clients = getattr(_local, "clients", None)
+    if clients is None:
+        clients = _local.clients = {}
+    client = clients.get(key)
+    if client is None:
+        client = clients[key] = ccxt.binanceusdm({
             "enableRateLimit": True,
             "apiKey": api_key or "",
             "secret": api_secret or "",
             "timeout": 10000,
             "options": {"defaultType": "future"},
         })
-        self.guard = RateLimitGuard()
+    return client
+
+
+class BinanceFuturesClient(ExchangeClient):
+    """CCXT wrapper for Binance USDⓈ-M futures."""
+
+    def __init__(self, api_key: str | None = None, api_secret: str | None = None) -> None:
+        key = api_key or "public"
+        self._credentials = (key, api_key, api_secret)
+        # One guard per key so every client in the process paces against the same quota.
+        # The guard reads Retry-After on the thread whose call failed, so the headers
+        # come from that thread's client and not from another thread's response.
+        self.guard = RateLimitGuard.get_shared(
+            key,
+            throttle_errors=(ccxt.RateLimitExceeded, ccxt.DDoSProtection),
+            retry_after=lambda _exc: parse_retry_after(
+                _thread_client(key, api_key, api_secret).last_response_headers
+            ),
+            state_path=state_path_for("binanceusdm", key),
+        )
+
+    @property
+    def client(self) -> ccxt.binanceusdm:
+        """The calling thread's ccxt client for these credentials."""
+        return _thread_client(*self._credentials)
 
     def fetch_ohlcv(self, symbol: str, timeframe: str, limit: int = 300) -> list[list[float]]:
         logger.info("fetch_ohlcv symbol={} timeframe={} limit={}", symbol, timeframe, limit)
@@ -33,10 +68,34 @@ class BinanceFuturesClient(ExchangeClient):
             context={"symbol": symbol, "endpoint": "fetch_ohlcv"},
         )
 
+    def fetch_ohlcv_batch(
+        self, symbols: Iterable[str], timeframe: str, limit: int = 300
+    ) -> dict[str, list[list[float]]]:
+        # Requests overlap on the network; the shared guard still caps the overall rate.
+        futures = {
+            _ohlcv_executor.submit(self.fetch_ohlcv, symbol, timeframe, limit): symbol
+            for symbol in symbols
+        }
+        results: dict[str, list[list[float]]] = {}
+        for future in as_completed(futures):
+            symbol = futures[future]
+            try:
+                results[symbol] = future.result()
+            except Exception as exc:  # noqa: BLE001 - one symbol must not sink the batch
+                logger.warning(
+                    "fetch_ohlcv_failed symbol={} timeframe={} error={}", symbol, timeframe, exc
+                )
+                results[symbol] = []
+        return results
+
+    # Tickers go stale within seconds, so they are only worth keeping in memory.
+    @ttl_cached(ttl=5, key="tickers", persist=False)
     def fetch_tickers(self) -> dict[str, Any]:
         logger.info("fetch_tickers")
         return self.guard.run(self.client.fetch_tickers, context={"endpoint": "fetch_tickers"})
 
+    # Market metadata changes at most daily; the disk copy keeps restarts warm.
+    @ttl_cached(ttl=86400, key="markets")
     def fetch_markets(self) -> Iterable[dict[str, Any]]:
         logger.info("fetch_markets")
         return self.guard.run(self.client.fetch_markets, context={"endpoint": "fetch_markets"})
@@ -53,6 +112,30 @@ class BinanceFuturesClient(ExchangeClient):
             context={"symbol": symbol, "endpoint": "create_order"},
         )
 
+    def create_orders(self, orders: list[dict[str, Any]]) -> list[Any]:
+        if not self.client.has.get("createOrders"):
+            return super().create_orders(orders)
+        logger.info("create_orders count={}", len(orders))
+        responses: list[Any] = []
+        # Binance accepts at most 5 orders per batchOrders request.
+        for start in range(0, len(orders), 5):
+            chunk = [
+                {
+                    "symbol": order["symbol"],
+                    "type": "limit" if order.get("price") else "market",
+                    "side": order["side"],
+                    "amount": order["amount"],
+                    "price": order.get("price"),
+                }
+                for order in orders[start : start + 5]
+            ]
+            responses.extend(
+                self.guard.run(
+                    self.client.create_orders, chunk, context={"endpoint": "create_orders"}
+                )
+            )
+        return responses
+
     def set_leverage(self, symbol: str, leverage: int) -> None:
         try:
             self.guard.run(
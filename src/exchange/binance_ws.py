@@ -0,0 +1,124 @@
+"""Binance USDⓈ-M kline stream via ccxt.pro websockets."""
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import Any, Iterable
+
+import ccxt.pro as ccxtpro
+from loguru import logger
+
+
+class KlineFeed:
+    """Background websocket subscription to ``<symbol>@kline_<tf>`` streams.
+
+    ccxt.pro multiplexes every symbol over a single connection. Candle updates
+    are buffered per symbol until :meth:`drain`, and :meth:`wait_for_close`
+    blocks until any subscribed candle closes. Candles can be missed while the
+    connection is down, so :meth:`take_gap` reports stream errors for the
+    caller to backfill over REST.
+    """
+
+    def __init__(self, api_key: str | None = None, api_secret: str | None = None) -> None:
+        self._config = {
+            "enableRateLimit": True,
+            "apiKey": api_key or "",
+            "secret": api_secret or "",
+            "options": {"defaultType": "future"},
+        }
+        self.symbols: tuple[str, ...] = ()
+        self.timeframe: str | None = None
+        self._lock = threading.Lock()
+        self._pending: dict[str, dict[int, list[float]]] = {}
+        self._last_open: dict[str, int] = {}
+        self._closed = threading.Event()
+        self._gap = threading.Event()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+
+    def subscribe(self, symbols: Iterable[str], timeframe: str) -> bool:
+        """Stream ``symbols``; returns False when already subscribed to the same set."""
+        wanted = tuple(sorted(set(symbols)))
+        if wanted == self.symbols and timeframe == self.timeframe:
+            return False
+        self.close()
+        self._gap.clear()
+        self.symbols, self.timeframe = wanted, timeframe
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="binance-ws", daemon=True
+        )
+        self._thread.start()
+        asyncio.run_coroutine_threadsafe(self._watch(wanted, timeframe), self._loop)
+        logger.info("ws_kline_subscribed symbols={} timeframe={}", len(wanted), timeframe)
+        return True
+
+    def drain(self) -> dict[str, list[list[float]]]:
+        """Return and clear the candles received since the last drain, oldest first."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            self._closed.clear()
+        return {
+            symbol: [candles[key] for key in sorted(candles)] for symbol, candles in pending.items()
+        }
+
+    def take_gap(self) -> bool:
+        """Return and clear whether the stream failed (and may have missed candles)."""
+        gap = self._gap.is_set()
+        self._gap.clear()
+        return gap
+
+    def wait_for_close(self, timeout: float) -> bool:
+        """Block until a candle closes or ``timeout`` elapses."""
+        return self._closed.wait(timeout)
+
+    def close(self) -> None:
+        if self._loop is None:
+            return
+        asyncio.run_coroutine_threadsafe(self._cancel_tasks(), self._loop).result(timeout=10)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        if self._thread is not None:
+            self._thread.join(timeout=10)
+        self._loop.close()
+        self._loop = None
+        self._thread = None
+        self.symbols, self.timeframe = (), None
+
+    async def _watch(self, symbols: tuple[str, ...], timeframe: str) -> None:
+        client = ccxtpro.binanceusdm(self._config)
+        subscriptions = [[symbol, timeframe] for symbol in symbols]
+        try:
+            while True:
+                try:
+                    update = await client.watch_ohlcv_for_symbols(subscriptions)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as exc:  # noqa: BLE001 - ccxt.pro reconnects on the next watch
+                    logger.warning("ws_kline_error error={}", exc)
+                    self._gap.set()
+                    await asyncio.sleep(1)
+                    continue
+                self._record(update, timeframe)
+        finally:
+            await client.close()
+
+    def _record(self, update: dict[str, dict[str, Any]], timeframe: str) -> None:
+        with self._lock:
+            for symbol, by_timeframe in update.items():
+                for candle in by_timeframe.get(timeframe, []):
+                    open_time = int(candle[0])
+                    last_open = self._last_open.get(symbol)
+                    # A newer open time means the previous candle just closed.
+                    if last_open is not None and open_time > last_open:
+                        self._closed.set()
+                    if last_open is None or open_time > last_open:
+                        self._last_open[symbol] = open_time
+                    self._pending.setdefault(symbol, {})[open_time] = candle
+
+    @staticmethod
+    async def _cancel_tasks() -> None:
+        current = asyncio.current_task()
+        tasks = [task for task in asyncio.all_tasks() if task is not current]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
@@ -0,0 +1,109 @@
+"""TTL cache for slow-changing exchange responses."""
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import threading
+import time
+from functools import wraps
+from pathlib import Path
+from typing import Any, Callable, TypeVar
+
+from loguru import logger
+
+DEFAULT_CACHE_DIR = Path.home() / ".tob" / "cache"
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def atomic_write_json(path: Path, payload: Any) -> None:
+    """Write ``payload`` as JSON through a sibling temp file so readers never see a partial file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.stem}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            json.dump(payload, handle)
+        os.replace(tmp_name, path)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
+
+
+class TTLCache:
+    """In-memory cache of ``{key: (expires_at, payload)}`` with optional JSON files on disk."""
+
+    def __init__(self, directory: Path | None = DEFAULT_CACHE_DIR) -> None:
+        self.directory = directory
+        self._entries: dict[str, tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def _path(self, key: str) -> Path | None:
+        return None if self.directory is None else self.directory / f"{key}.json"
+
+    def get(self, key: str) -> Any | None:
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None:
+            entry = self._load(key)
+        if entry is None or entry[0] <= now:
+            return None
+        return entry[1]
+
+    def set(self, key: str, payload: Any, ttl: float, persist: bool = True) -> None:
+        entry = (time.time() + ttl, payload)
+        with self._lock:
+            self._entries[key] = entry
+        if persist:
+            self._store(key, entry)
+
+    def _load(self, key: str) -> tuple[float, Any] | None:
+        path = self._path(key)
+        if path is None or not path.exists():
+            return None
+        try:
+            with path.open("r", encoding="utf-8") as handle:
+                data = json.load(handle)
+            entry = (float(data["expires_at"]), data["payload"])
+        except (OSError, ValueError, KeyError, TypeError) as exc:
+            logger.warning("cache_load_failed key={} error={}", key, exc)
+            return None
+        with self._lock:
+            self._entries[key] = entry
+        return entry
+
+    def _store(self, key: str, entry: tuple[float, Any]) -> None:
+        path = self._path(key)
+        if path is None:
+            return
+        try:
+            atomic_write_json(path, {"expires_at": entry[0], "payload": entry[1]})
+        except (OSError, TypeError, ValueError) as exc:
+            logger.warning("cache_store_failed key={} error={}", key, exc)
+
+
+default_cache = TTLCache()
+
+
+def ttl_cached(
+    ttl: float, key: str | None = None, persist: bool = True, cache: TTLCache | None = None
+) -> Callable[[F], F]:
+    """Cache a no-argument method's result for ``ttl`` seconds under ``key`` (default: its name)."""
+
+    def decorator(func: F) -> F:
+        cache_key = key or func.__name__
+
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            store = cache or default_cache
+            cached = store.get(cache_key)
+            if cached is not None:
+                return cached
+            result = func(*args, **kwargs)
+            store.set(cache_key, result, ttl, persist=persist)
+            return result
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
@@ -1,32 +1,86 @@
 """Precision utilities for Binance Futures."""
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from math import floor
 
+import numpy as np
 
-@dataclass
+# Relative slack when checking that a step size is an exact reciprocal (0.01 -> 100).
+_SCALE_TOLERANCE = 1e-9
+# Products like 1.15 * 100 land a few ulps below an exact multiple; anything further
+# off is a genuine fraction of a tick and must be floored, however large the value.
+_ROUNDING_SLACK = 4 * np.finfo(np.float64).eps
+
+
+def _step_scale(step: float) -> int:
+    """Return ``1 / step`` when it is an integer (0.01 -> 100), else 0."""
+    if step <= 0:
+        return 0
+    inverse = 1 / step
+    scale = round(inverse)
+    if scale < 1 or abs(inverse - scale) > _SCALE_TOLERANCE * inverse:
+        return 0
+    return scale
+
+
+@dataclass(slots=True)
 class SymbolPrecision:
     tick_size: float
     step_size: float
     min_qty: float
     min_notional: float
+    tick_scale: int = field(init=False)
+    step_scale: int = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.tick_scale = _step_scale(self.tick_size)
+        self.step_scale = _step_scale(self.step_size)
 
 
-def _round_step(value: float, step: float) -> float:
+def _round_step(value: float, step: float, scale: int = 0) -> float:
     if step == 0:
         return value
-    return floor(value / step) * step
+    if not scale:
+        return floor(value / step) * step
+    # Floor in whole ticks, then divide by the integer scale so the result is
+    # the correctly rounded decimal (1.15, not 1.1500000000000001).
+    scaled = value * scale
+    units = round(scaled)
+    if abs(scaled - units) > _ROUNDING_SLACK * abs(scaled):
+        units = floor(scaled)
+    return units / scale
 
 
 def normalize_price(price: float, precision: SymbolPrecision) -> float:
     """Normalize price to tick size."""
-    return _round_step(price, precision.tick_size)
+    return _round_step(price, precision.tick_size, precision.tick_scale)
 
 
 def normalize_qty(qty: float, precision: SymbolPrecision) -> float:
     """Normalize quantity to step size."""
-    return _round_step(qty, precision.step_size)
+    return _round_step(qty, precision.step_size, precision.step_scale)
+
+
+def normalize_array(values: np.ndarray, scales: np.ndarray) -> np.ndarray:
+    """Floor many values to their tick/step scales at once (e.g. one price per symbol)."""
+    scaled = values * scales
+    units = np.rint(scaled)
+    off_grid = np.abs(scaled - units) > _ROUNDING_SLACK * np.abs(scaled)
+    np.floor(scaled, out=units, where=off_grid)
+    return units / scales
+
+
+def normalize_many(values: list[float], sizes: list[float], scales: list[int]) -> list[float]:
+    """Normalize values with per-value sizes; scaled ones go through one numpy pass."""
+    values_arr = np.asarray(values, dtype=np.float64)
+    scales_arr = np.asarray(scales, dtype=np.int64)
+    scaled = scales_arr > 0
+    normalized = values_arr.copy()
+    normalized[scaled] = normalize_array(values_arr[scaled], scales_arr[scaled])
+    for i in np.flatnonzero(~scaled):
+        normalized[i] = _round_step(values[i], sizes[i])
+    return normalized.tolist()
 
 
 def validate_order(price: float, qty: float, precision: SymbolPrecision) -> list[str]:
@@ -37,4 +91,3 @@ def validate_order(price: float, qty: float, precision: SymbolPrecision) -> list
     if price * qty < precision.min_notional:
         errors.append("min_notional")
     return errors
-
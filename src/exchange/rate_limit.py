@@ -1,21 +1,41 @@
-"""Rate limit guard with backoff and circuit breaker."""
+"""Rate limit guard with adaptive token bucket, backoff and circuit breaker."""
 from __future__ import annotations
 
+import hashlib
+import json
+import random
+import threading
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from pathlib import Path
 from typing import Any, Callable
 
 from loguru import logger
 
+from exchange.cache import atomic_write_json
 
-@dataclass
+DEFAULT_STATE_DIR = Path.home() / ".tob"
+
+
+def state_path_for(host: str, key: str) -> Path:
+    """State file for one host/credential pair; the key is hashed, never written out."""
+    digest = hashlib.sha256(key.encode()).hexdigest()[:16]
+    return DEFAULT_STATE_DIR / f"rate_limit_{host}_{digest}.json"
+
+
+@dataclass(slots=True)
 class CircuitBreaker:
     max_failures: int = 5
     cooldown_seconds: int = 30
     failures: int = 0
     opened_at: float | None = None
+    banned_until: float | None = None
 
     def can_execute(self) -> bool:
+        if self.banned_until is not None:
+            if time.time() < self.banned_until:
+                return False
+            self.banned_until = None
         if self.opened_at is None:
             return True
         if time.time() - self.opened_at > self.cooldown_seconds:
@@ -33,34 +53,176 @@ class CircuitBreaker:
         self.failures = 0
         self.opened_at = None
 
+    def ban(self, seconds: float) -> None:
+        """Block all calls for ``seconds``, e.g. after an exchange IP ban."""
+        until = time.time() + seconds
+        self.banned_until = max(self.banned_until or 0.0, until)
+
+
+@dataclass
+class TokenBucket:
+    """Token bucket whose refill rate adapts to throttling (AIMD).
+
+    The rate grows additively after each successful call and is cut
+    multiplicatively when the exchange signals a rate limit.
+    """
+
+    rate: float = 10.0
+    capacity: float = 10.0
+    min_rate: float = 0.5
+    max_rate: float = 20.0
+    increase: float = 0.1
+    decrease: float = 0.5
+    tokens: float = 10.0
+    last_refill: float = field(default_factory=time.monotonic)
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False, compare=False
+    )
+
+    def acquire(self) -> None:
+        # Reserve the token under the lock (possibly going into debt) and sleep
+        # outside it, so concurrent callers queue up instead of blocking each other.
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+            self.last_refill = now
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        if wait:
+            time.sleep(wait)
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.increase)
+
+    def record_throttle(self) -> None:
+        with self._lock:
+            self.rate = max(self.min_rate, self.rate * self.decrease)
+
+
+def parse_retry_after(headers: Any) -> float | None:
+    """Return the Retry-After delay in seconds from response headers, if present."""
+    if not headers:
+        return None
+    value = headers.get("Retry-After") or headers.get("retry-after")
+    try:
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _retry_after_from_error(exc: Exception) -> float | None:
+    response = getattr(exc, "response", None)
+    return parse_retry_after(getattr(response, "headers", None))
+
 
 class RateLimitGuard:
-    """Simple retry/backoff guard for exchange calls."""
+    """Token-bucket pacing with retry/backoff for exchange calls."""
+
+    _shared: dict[str, RateLimitGuard] = {}
+    _shared_lock = threading.Lock()
 
-    def __init__(self, breaker: CircuitBreaker | None = None, max_retries: int = 4) -> None:
+    def __init__(
+        self,
+        breaker: CircuitBreaker | None = None,
+        max_retries: int = 4,
+        bucket: TokenBucket | None = None,
+        throttle_errors: tuple[type[Exception], ...] = (),
+        retry_after: Callable[[Exception], float | None] = _retry_after_from_error,
+        state_path: Path | None = None,
+    ) -> None:
         self.breaker = breaker or CircuitBreaker()
         self.max_retries = max_retries
+        self.bucket = bucket or TokenBucket()
+        self.throttle_errors = throttle_errors
+        self.retry_after = retry_after
+        self.state_path = state_path
+        self._lock = threading.Lock()
+        if state_path is not None:
+            self._load_state()
+
+    @classmethod
+    def get_shared(cls, key: str, **kwargs: Any) -> RateLimitGuard:
+        """Return the process-wide guard for ``key``, creating it on first use.
+
+        Every client using the same credentials draws from one quota, so they
+        must share one bucket and breaker. ``kwargs`` only apply on creation.
+        """
+        with cls._shared_lock:
+            guard = cls._shared.get(key)
+            if guard is None:
+                guard = cls._shared[key] = cls(**kwargs)
+            return guard
 
     def run(self, func: Callable[..., Any], *args: Any, context: dict[str, Any] | None = None, **kwargs: Any) -> Any:
-        if not self.breaker.can_execute():
+        with self._lock:
+            can_execute = self.breaker.can_execute()
+        if not can_execute:
             raise RuntimeError("Circuit breaker open")
         context = context or {}
         delay = 1.0
         for attempt in range(1, self.max_retries + 1):
+            self.bucket.acquire()
             try:
                 result = func(*args, **kwargs)
-                self.breaker.record_success()
+                self.bucket.record_success()
+                with self._lock:
+                    recovered = self.breaker.failures > 0 or self.breaker.opened_at is not None
+                    self.breaker.record_success()
+                    # Only write on a state change, not on every healthy call.
+                    if recovered:
+                        self._save_state()
                 return result
             except Exception as exc:  # noqa: BLE001 - network errors vary
-                self.breaker.record_failure()
+                throttled = isinstance(exc, self.throttle_errors)
+                retry_after = self.retry_after(exc) if throttled else None
+                if throttled:
+                    self.bucket.record_throttle()
+                with self._lock:
+                    self.breaker.record_failure()
+                    # A Retry-After longer than the breaker cooldown is an IP ban (HTTP 418);
+                    # record it so a restart does not resume hammering the exchange.
+                    if retry_after is not None and retry_after > self.breaker.cooldown_seconds:
+                        self.breaker.ban(retry_after)
+                    self._save_state()
                 logger.warning(
-                    "rate_limit_guard_error attempt={} error={} context={}",
+                    "rate_limit_guard_error attempt={} throttled={} error={} context={}",
                     attempt,
+                    throttled,
                     exc,
                     context,
                 )
                 if attempt == self.max_retries:
                     raise
-                time.sleep(delay)
+                # Jitter keeps concurrent callers from retrying in lockstep.
+                jittered = delay * (0.5 + random.random())
+                time.sleep(retry_after if retry_after is not None else jittered)
                 delay *= 2
 
+    def _load_state(self) -> None:
+        try:
+            data = json.loads(self.state_path.read_text())
+            self.breaker.failures = int(data["failures"])
+            self.breaker.opened_at = data["opened_at"]
+            self.breaker.banned_until = data["banned_until"]
+            self.bucket.rate = float(data["rate"])
+            self.bucket.tokens = min(self.bucket.capacity, float(data["tokens"]))
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError, KeyError, TypeError) as exc:
+            logger.warning("rate_limit_state_load_failed path={} error={}", self.state_path, exc)
+
+    def _save_state(self) -> None:
+        if self.state_path is None:
+            return
+        state = {
+            "failures": self.breaker.failures,
+            "opened_at": self.breaker.opened_at,
+            "banned_until": self.breaker.banned_until,
+            "rate": self.bucket.rate,
+            "tokens": self.bucket.tokens,
+        }
+        try:
+            atomic_write_json(self.state_path, state)
+        except (OSError, TypeError, ValueError) as exc:
+            logger.warning("rate_limit_state_save_failed path={} error={}", self.state_path, exc)
@@ -4,8 +4,10 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Any
 
+import numpy as np
 
-@dataclass
+
+@dataclass(slots=True)
 class PaperTradeResult:
     status: str
     exit_price: float | None
@@ -49,3 +51,31 @@ def simulate_trade(
     fees = fee_rate * 2
     return PaperTradeResult(status=status, exit_price=exit_price, pnl_pct=pnl_pct, fees=fees, meta={})
 
+
+def simulate_trades(
+    directions: np.ndarray,
+    entry_prices: np.ndarray,
+    stop_prices: np.ndarray,
+    take_prices: np.ndarray,
+    candle_highs: np.ndarray,
+    candle_lows: np.ndarray,
+    worst_case_same_candle: bool = True,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Array version of :func:`simulate_trade`.
+
+    ``directions`` holds ``"LONG"``/``"SHORT"`` strings or +1/-1 signs. Returns
+    ``(statuses, exit_prices, pnl_pcts)``; trades still open get NaN exit price
+    and pnl.
+    """
+    is_long = directions == "LONG" if directions.dtype.kind in "OUS" else directions > 0
+    hit_stop = np.where(is_long, candle_lows <= stop_prices, candle_highs >= stop_prices)
+    hit_take = np.where(is_long, candle_highs >= take_prices, candle_lows <= take_prices)
+    stopped = hit_stop if worst_case_same_candle else hit_stop & ~hit_take
+    taken = hit_take & ~stopped
+
+    exit_prices = np.where(stopped, stop_prices, np.where(taken, take_prices, np.nan))
+    pnl_pcts = (exit_prices - entry_prices) / entry_prices
+    np.negative(pnl_pcts, out=pnl_pcts, where=~is_long)
+    statuses = np.where(stopped, "STOP", np.where(taken, "TAKE", "OPEN"))
+    return statuses, exit_prices, pnl_pcts
+
@@ -0,0 +1,90 @@
+"""Open paper positions held as parallel arrays."""
+from __future__ import annotations
+
+from typing import Any, Iterable, Iterator
+
+import numpy as np
+
+LONG = 1
+SHORT = -1
+
+
+class OpenPositions:
+    """Open trades in struct-of-arrays form, one row per trade.
+
+    Prices, ids and direction signs (``LONG``/``SHORT``) sit in contiguous
+    numpy arrays so a symbol's trades can be resolved in one vectorized pass.
+    Closing a trade only drops its row from the symbol's list; the arrays are
+    rebuilt from the repository every cycle, so closed rows never pile up.
+    """
+
+    def __init__(self, capacity: int = 8) -> None:
+        self.ids = np.zeros(capacity, dtype=np.int64)
+        self.entry_prices = np.zeros(capacity, dtype=np.float64)
+        self.stop_prices = np.zeros(capacity, dtype=np.float64)
+        self.take_prices = np.zeros(capacity, dtype=np.float64)
+        self.directions = np.zeros(capacity, dtype=np.int8)
+        self._size = 0
+        self._rows_by_symbol: dict[str, list[int]] = {}
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Any]) -> OpenPositions:
+        """Build from ``trades_simulated`` rows joined with their signal's symbol."""
+        rows = list(rows)
+        positions = cls(capacity=max(8, len(rows)))
+        for row in rows:
+            positions.add(
+                int(row["id"]),
+                row["symbol"],
+                row["direction"],
+                float(row["entry_price"]),
+                float(row["stop_price"]),
+                float(row["take_price"]),
+            )
+        return positions
+
+    def __len__(self) -> int:
+        return sum(len(rows) for rows in self._rows_by_symbol.values())
+
+    def __contains__(self, symbol: object) -> bool:
+        return symbol in self._rows_by_symbol
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over symbols that have at least one open trade."""
+        return iter(self._rows_by_symbol)
+
+    def rows(self, symbol: str) -> np.ndarray:
+        """Array rows of the symbol's open trades."""
+        return np.array(self._rows_by_symbol.get(symbol, ()), dtype=np.intp)
+
+    def add(
+        self, trade_id: int, symbol: str, direction: str, entry: float, stop: float, take: float
+    ) -> int:
+        if self._size == len(self.ids):
+            self._grow()
+        row = self._size
+        self.ids[row] = trade_id
+        self.entry_prices[row] = entry
+        self.stop_prices[row] = stop
+        self.take_prices[row] = take
+        self.directions[row] = LONG if direction == "LONG" else SHORT
+        self._size += 1
+        self._rows_by_symbol.setdefault(symbol, []).append(row)
+        return row
+
+    def close(self, symbol: str, row: int) -> None:
+        rows = self._rows_by_symbol[symbol]
+        rows.remove(row)
+        if not rows:
+            del self._rows_by_symbol[symbol]
+
+    def direction(self, row: int) -> str:
+        return "LONG" if self.directions[row] == LONG else "SHORT"
+
+    def _grow(self) -> None:
+        capacity = 2 * len(self.ids)
+        for name in ("ids", "entry_prices", "stop_prices", "take_prices", "directions"):
+            current = getattr(self, name)
+            grown = np.zeros(capacity, dtype=current.dtype)
+            grown[: len(current)] = current
+            setattr(self, name, grown)
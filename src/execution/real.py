@@ -7,10 +7,16 @@ from typing import Any
 from loguru import logger
 
 from exchange.base import ExchangeClient
-from exchange.precision import SymbolPrecision, normalize_price, normalize_qty, validate_order
+from exchange.precision import (
+    SymbolPrecision,
+    normalize_many,
+    normalize_price,
+    normalize_qty,
+    validate_order,
+)
 
 
-@dataclass
+@dataclass(slots=True)
 class RealExecutionResult:
     status: str
     details: dict[str, Any]
@@ -43,3 +49,63 @@ def execute_trade(
     response = exchange.create_order(symbol, side, norm_qty, norm_price)
     return RealExecutionResult("SUBMITTED", {"response": response})
 
+
+def execute_trades_batch(
+    exchange: ExchangeClient,
+    trades: list[dict[str, Any]],
+    precision_map: dict[str, SymbolPrecision],
+    enabled: bool,
+    dry_run: bool = True,
+) -> list[RealExecutionResult]:
+    """Batch version of :func:`execute_trade` for ``{symbol, direction, qty, price}`` dicts.
+
+    Results are returned in the same order as ``trades``; valid orders go out in
+    as few exchange requests as the client allows.
+    """
+    if not enabled:
+        return [
+            RealExecutionResult("DISABLED", {"reason": "execute_real_trades=false"})
+            for _ in trades
+        ]
+    if not trades:
+        return []
+
+    precisions = [precision_map[trade["symbol"]] for trade in trades]
+    prices = normalize_many(
+        [trade["price"] for trade in trades],
+        [p.tick_size for p in precisions],
+        [p.tick_scale for p in precisions],
+    )
+    qtys = normalize_many(
+        [trade["qty"] for trade in trades],
+        [p.step_size for p in precisions],
+        [p.step_scale for p in precisions],
+    )
+
+    results: list[RealExecutionResult | None] = [None] * len(trades)
+    orders: list[dict[str, Any]] = []
+    order_slots: list[int] = []
+    for i, (trade, precision, price, qty) in enumerate(zip(trades, precisions, prices, qtys)):
+        errors = validate_order(price, qty, precision)
+        if errors:
+            results[i] = RealExecutionResult("REJECTED", {"errors": errors})
+        elif dry_run:
+            logger.info(
+                "dry_run_order symbol={} direction={} qty={} price={}",
+                trade["symbol"],
+                trade["direction"],
+                qty,
+                price,
+            )
+            results[i] = RealExecutionResult(
+                "DRY_RUN", {"symbol": trade["symbol"], "qty": qty, "price": price}
+            )
+        else:
+            side = "buy" if trade["direction"] == "LONG" else "sell"
+            orders.append({"symbol": trade["symbol"], "side": side, "amount": qty, "price": price})
+            order_slots.append(i)
+
+    if orders:
+        for i, response in zip(order_slots, exchange.create_orders(orders)):
+            results[i] = RealExecutionResult("SUBMITTED", {"response": response})
+    return results  # type: ignore[return-value]
@@ -1,8 +1,10 @@
 """Streamlit-based GUI for configuring and observing TOB."""
 from __future__ import annotations
 
+import copy
 import sqlite3
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -15,8 +17,8 @@ PROJECT_ROOT = Path(__file__).resolve().parents[2]
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
-from backtest.engine import run_backtest
-from config.settings import Settings
+from backtest.engine import BacktestResult, run_backtest
+from config.settings import Settings, read_yaml
 from runner import run_live
 from storage.repo import SQLiteRepository
 
@@ -25,9 +27,8 @@ ENV_PATH = PROJECT_ROOT / ".env"
 
 
 def _load_yaml(path: Path) -> dict[str, Any]:
-    if not path.exists():
-        return {}
-    return yaml.safe_load(path.read_text()) or {}
+    # Streamlit reruns the script on every interaction; the parse is cached until the file changes.
+    return copy.deepcopy(read_yaml(path))
 
 
 def _write_yaml(path: Path, data: dict[str, Any]) -> None:
@@ -37,8 +38,14 @@ def _write_yaml(path: Path, data: dict[str, Any]) -> None:
 def _load_env(path: Path) -> dict[str, str]:
     if not path.exists():
         return {}
+    stat = path.stat()
+    return dict(_parse_env(str(path), stat.st_mtime_ns, stat.st_size))
+
+
+@lru_cache(maxsize=4)
+def _parse_env(path: str, mtime_ns: int, size: int) -> dict[str, str]:
     entries = {}
-    for line in path.read_text().splitlines():
+    for line in Path(path).read_text().splitlines():
         if not line or line.startswith("#") or "=" not in line:
             continue
         key, value = line.split("=", 1)
@@ -58,15 +65,21 @@ def _settings_to_config(settings: Settings) -> dict[str, Any]:
     return payload
 
 
+@st.cache_resource
+def _read_connection(db_path: str) -> sqlite3.Connection:
+    # One read-only connection for the whole app, so the dashboard never contends
+    # for the live loop's write lock and skips the connect cost on every query.
+    conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True, check_same_thread=False)
+    conn.execute("PRAGMA cache_size=-20000")
+    return conn
+
+
+# Short TTL so widget reruns reuse the last read instead of hitting SQLite on every keypress.
+@st.cache_data(ttl=2)
 def _read_table(db_path: Path, query: str, params: tuple[Any, ...] = ()) -> pd.DataFrame:
     if not db_path.exists():
         return pd.DataFrame()
-    with sqlite3.connect(db_path) as conn:
-        conn.row_factory = sqlite3.Row
-        rows = conn.execute(query, params).fetchall()
-    if not rows:
-        return pd.DataFrame()
-    return pd.DataFrame([dict(row) for row in rows])
+    return pd.read_sql_query(query, _read_connection(str(db_path)), params=params)
 
 
 def render_sidebar(settings: Settings) -> None:
@@ -103,8 +116,6 @@ def render_settings_editor(settings: Settings) -> Settings:
     st.header("Configuração")
     st.caption("Atualize parâmetros e salve em config.yaml.")
 
-    config_payload = _settings_to_config(settings)
-
     with st.form("settings_form"):
         col1, col2 = st.columns(2)
         with col1:
@@ -224,68 +235,73 @@ def render_settings_editor(settings: Settings) -> Settings:
         live_candle_limit = st.number_input(
             "Limite de candles", min_value=100, value=live.candle_limit, step=10
         )
+        live_use_websocket = st.checkbox("Usar websocket", value=live.use_websocket)
 
         save_config = st.form_submit_button("Salvar config.yaml")
 
-    if save_config:
-        config_payload.update(
-            {
-                "execute_real_trades": execute_real_trades,
-                "log_json": log_json,
-                "data_dir": data_dir,
-                "db_path": db_path,
-                "risk": {
-                    "risk_per_trade_pct": risk_per_trade_pct / 100,
-                    "max_daily_loss_r": max_daily_loss_r,
-                    "max_positions": int(max_positions),
-                    "cooldown_candles": int(cooldown_candles),
-                    "trailing_stop": trailing_stop,
-                    "fee_rate": fee_rate,
-                    "stop_atr_mult": stop_atr_mult,
-                    "take_atr_mult": take_atr_mult,
-                    "cluster_corr_threshold": cluster_corr_threshold,
-                    "max_positions_per_cluster": int(max_positions_per_cluster),
-                },
-                "universe": {
-                    "volume_percentile": volume_percentile,
-                    "min_atr_pct": min_atr_pct / 100,
-                    "min_beta_btc": min_beta_btc,
-                    "min_corr_btc": min_corr_btc,
-                    "max_symbols": int(max_symbols),
-                    "weights": {
-                        "volume": weight_volume,
-                        "atr_pct": weight_atr,
-                        "beta": weight_beta,
-                    },
-                    "manual_override": [
-                        item.strip() for item in manual_override.split(",") if item.strip()
-                    ],
-                },
-                "market_quality": {
-                    "min_trade_score": int(min_trade_score),
-                    "reduced_risk_score": int(reduced_risk_score),
-                    "spread_penalty": int(spread_penalty),
-                    "atr_low_penalty": int(atr_low_penalty),
-                    "adx_low_penalty": int(adx_low_penalty),
-                    "wick_penalty": int(wick_penalty),
-                    "liquidity_bonus": int(liquidity_bonus),
-                    "direction_bonus": int(direction_bonus),
-                },
-                "execution": {
-                    "execute_real_trades": execute_real_trades,
-                    "entry_on": execution_entry_on,
-                    "worst_case_same_candle": worst_case_same_candle,
-                },
-                "live": {
-                    "loop_seconds": int(live_loop_seconds),
-                    "timeframe": live_timeframe,
-                    "candle_limit": int(live_candle_limit),
-                },
-            }
-        )
-        _write_yaml(CONFIG_PATH, config_payload)
-        st.success("Configuração salva em config.yaml")
+    if not save_config:
+        # Nothing changed on disk, so skip re-reading and re-validating the YAML.
+        return settings
 
+    config_payload = _settings_to_config(settings)
+    config_payload.update(
+        {
+            "execute_real_trades": execute_real_trades,
+            "log_json": log_json,
+            "data_dir": data_dir,
+            "db_path": db_path,
+            "risk": {
+                "risk_per_trade_pct": risk_per_trade_pct / 100,
+                "max_daily_loss_r": max_daily_loss_r,
+                "max_positions": int(max_positions),
+                "cooldown_candles": int(cooldown_candles),
+                "trailing_stop": trailing_stop,
+                "fee_rate": fee_rate,
+                "stop_atr_mult": stop_atr_mult,
+                "take_atr_mult": take_atr_mult,
+                "cluster_corr_threshold": cluster_corr_threshold,
+                "max_positions_per_cluster": int(max_positions_per_cluster),
+            },
+            "universe": {
+                "volume_percentile": volume_percentile,
+                "min_atr_pct": min_atr_pct / 100,
+                "min_beta_btc": min_beta_btc,
+                "min_corr_btc": min_corr_btc,
+                "max_symbols": int(max_symbols),
+                "weights": {
+                    "volume": weight_volume,
+                    "atr_pct": weight_atr,
+                    "beta": weight_beta,
+                },
+                "manual_override": [
+                    item.strip() for item in manual_override.split(",") if item.strip()
+                ],
+            },
+            "market_quality": {
+                "min_trade_score": int(min_trade_score),
+                "reduced_risk_score": int(reduced_risk_score),
+                "spread_penalty": int(spread_penalty),
+                "atr_low_penalty": int(atr_low_penalty),
+                "adx_low_penalty": int(adx_low_penalty),
+                "wick_penalty": int(wick_penalty),
+                "liquidity_bonus": int(liquidity_bonus),
+                "direction_bonus": int(direction_bonus),
+            },
+            "execution": {
+                "execute_real_trades": execute_real_trades,
+                "entry_on": execution_entry_on,
+                "worst_case_same_candle": worst_case_same_candle,
+            },
+            "live": {
+                "loop_seconds": int(live_loop_seconds),
+                "timeframe": live_timeframe,
+                "candle_limit": int(live_candle_limit),
+                "use_websocket": live_use_websocket,
+            },
+        }
+    )
+    _write_yaml(CONFIG_PATH, config_payload)
+    st.success("Configuração salva em config.yaml")
     return Settings.load(CONFIG_PATH)
 
 
@@ -315,6 +331,30 @@ def render_live_controls(settings: Settings) -> None:
         st.success("Ciclo finalizado.")
 
 
+@st.cache_data(ttl=3600, show_spinner="Processando backtest...")
+def _cached_backtest(
+    symbol: str,
+    timeframe: str,
+    settings_json: str,
+    limit: int,
+    min_window: int,
+) -> BacktestResult:
+    # Keyed on the serialized settings so any config change reruns the backtest.
+    settings = Settings.model_validate_json(settings_json)
+    repo = SQLiteRepository(str(settings.db_path))
+    try:
+        return run_backtest(
+            symbol=symbol,
+            timeframe=timeframe,
+            settings=settings,
+            repo=repo,
+            limit=limit,
+            min_window=min_window,
+        )
+    finally:
+        repo.close()
+
+
 def render_backtest(settings: Settings) -> None:
     st.header("Backtest")
     st.caption("Backtest simples baseado em candles armazenados no SQLite.")
@@ -327,16 +367,13 @@ def render_backtest(settings: Settings) -> None:
         run_bt = st.form_submit_button("Executar backtest")
 
     if run_bt:
-        repo = SQLiteRepository(str(settings.db_path))
-        with st.spinner("Processando backtest..."):
-            result = run_backtest(
-                symbol=symbol,
-                timeframe=timeframe,
-                settings=settings,
-                repo=repo,
-                limit=int(limit),
-                min_window=int(min_window),
-            )
+        result = _cached_backtest(
+            symbol,
+            timeframe,
+            settings.model_dump_json(),
+            int(limit),
+            int(min_window),
+        )
         st.success("Backtest concluído.")
         summary = result.summary
         st.metric("Trades", summary.total_trades)
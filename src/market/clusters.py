@@ -2,53 +2,59 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import Iterable
 
+import numpy as np
 import pandas as pd
 
 
-@dataclass
+@dataclass(slots=True)
 class ClusterResult:
     clusters: dict[str, int]
     matrix: pd.DataFrame
 
 
-def _union_find(items: list[str], pairs: list[tuple[str, str]]) -> dict[str, int]:
-    parent = {item: item for item in items}
+def _union_find(size: int, pairs: Iterable[tuple[int, int]]) -> list[int]:
+    """Group positions ``0..size-1`` joined by ``pairs``; returns a cluster id per position."""
+    parent = list(range(size))
+    rank = [0] * size
 
-    def find(item: str) -> str:
+    def find(item: int) -> int:
         while parent[item] != item:
             parent[item] = parent[parent[item]]
             item = parent[item]
         return item
 
-    def union(a: str, b: str) -> None:
+    def union(a: int, b: int) -> None:
         ra, rb = find(a), find(b)
-        if ra != rb:
-            parent[rb] = ra
+        if ra == rb:
+            return
+        # Union by rank keeps trees shallow, so finds stay near-constant time.
+        if rank[ra] < rank[rb]:
+            ra, rb = rb, ra
+        parent[rb] = ra
+        if rank[ra] == rank[rb]:
+            rank[ra] += 1
 
     for a, b in pairs:
         union(a, b)
 
-    root_map: dict[str, int] = {}
-    clusters: dict[str, int] = {}
-    next_id = 0
-    for item in items:
+    root_map: dict[int, int] = {}
+    clusters: list[int] = []
+    for item in range(size):
         root = find(item)
         if root not in root_map:
-            root_map[root] = next_id
-            next_id += 1
-        clusters[item] = root_map[root]
+            root_map[root] = len(root_map)
+        clusters.append(root_map[root])
     return clusters
 
 
 def build_clusters(returns: pd.DataFrame, threshold: float) -> ClusterResult:
     corr = returns.corr()
-    pairs: list[tuple[str, str]] = []
     symbols = list(corr.columns)
-    for i, sym_a in enumerate(symbols):
-        for sym_b in symbols[i + 1 :]:
-            if corr.loc[sym_a, sym_b] >= threshold:
-                pairs.append((sym_a, sym_b))
-    clusters = _union_find(symbols, pairs)
+    # Scan the upper triangle in one numpy pass instead of a .loc lookup per pair.
+    rows, cols = np.triu_indices(len(symbols), k=1)
+    mask = corr.to_numpy()[rows, cols] >= threshold
+    pairs = zip(rows[mask].tolist(), cols[mask].tolist())
+    clusters = dict(zip(symbols, _union_find(len(symbols), pairs)))
     return ClusterResult(clusters, corr)
-
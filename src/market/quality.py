@@ -3,29 +3,46 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+import numpy as np
 import pandas as pd
 
-from strategy.indicators import adx, atr
+from strategy.indicators import IndicatorBundle
 
 
-@dataclass
+@dataclass(slots=True)
 class QualityResult:
     score: int
     meta: dict
 
 
+def _wick_ratios(df: pd.DataFrame, tail: int | None = None) -> np.ndarray:
+    """Per-candle wick/body ratio, optionally for the last ``tail`` rows only."""
+    rows = slice(None) if tail is None else slice(-tail, None)
+    # Slice before casting so non-float columns only convert the rows in use.
+    close = df["close"].to_numpy()[rows].astype(np.float64, copy=False)
+    open_ = df["open"].to_numpy()[rows].astype(np.float64, copy=False)
+    high = df["high"].to_numpy()[rows].astype(np.float64, copy=False)
+    low = df["low"].to_numpy()[rows].astype(np.float64, copy=False)
+    body = np.abs(close - open_)
+    wicks = (high - np.maximum(close, open_)) + (np.minimum(close, open_) - low)
+    return wicks / np.where(body == 0, 1.0, body)
+
+
 def _wick_ratio(df: pd.DataFrame) -> float:
-    body = (df["close"] - df["open"]).abs()
-    wicks = (df["high"] - df[["close", "open"]].max(axis=1)) + (
-        df[["close", "open"]].min(axis=1) - df["low"]
-    )
-    return float((wicks / body.replace(0, 1)).tail(20).mean())
+    return float(np.mean(_wick_ratios(df, tail=20)))
 
 
-def market_quality_score(df: pd.DataFrame, spread: float, liquidity: float, settings: object) -> QualityResult:
-    atr_val = atr(df, 14).iloc[-1]
-    atr_pct = atr_val / df["close"].iloc[-1]
-    adx_val = adx(df, 14).iloc[-1]
+def market_quality_score(
+    df: pd.DataFrame,
+    spread: float,
+    liquidity: float,
+    settings: object,
+    bundle: IndicatorBundle | None = None,
+) -> QualityResult:
+    if bundle is None:
+        bundle = IndicatorBundle(df)
+    atr_pct = bundle.atr_pct.to_numpy()[-1]
+    adx_val = bundle.adx14.to_numpy()[-1]
     wick_ratio = _wick_ratio(df)
 
     score = 100
@@ -52,3 +69,28 @@ def market_quality_score(df: pd.DataFrame, spread: float, liquidity: float, sett
     }
     return QualityResult(score, meta)
 
+
+def market_quality_series(
+    df: pd.DataFrame,
+    spread: float,
+    liquidity: float,
+    settings: object,
+    bundle: IndicatorBundle | None = None,
+) -> pd.Series:
+    """Quality score for every row, equivalent to scoring each expanding window."""
+    if bundle is None:
+        bundle = IndicatorBundle(df)
+    atr_pct = bundle.atr_pct
+    adx_val = bundle.adx14
+    wick_ratio = pd.Series(_wick_ratios(df), index=df.index).rolling(20, min_periods=1).mean()
+
+    score = np.full(len(df), 100, dtype=np.int64)
+    if spread > 0.002:
+        score -= settings.spread_penalty
+    score -= np.where(atr_pct < 0.003, settings.atr_low_penalty, 0)
+    score -= np.where(adx_val < 18, settings.adx_low_penalty, 0)
+    score -= np.where(wick_ratio > 2.5, settings.wick_penalty, 0)
+    if liquidity > 1e7:
+        score += settings.liquidity_bonus
+    score += np.where(adx_val > 25, settings.direction_bonus, 0)
+    return pd.Series(np.clip(score, 0, 100), index=df.index)
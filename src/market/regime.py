@@ -6,22 +6,26 @@ from dataclasses import dataclass
 import numpy as np
 import pandas as pd
 
-from strategy.indicators import adx, atr, bb_width, ema
+from strategy.indicators import IndicatorBundle
 
 
-@dataclass
+@dataclass(slots=True)
 class RegimeResult:
     regime: str
     meta: dict
 
 
-def detect_regime(df: pd.DataFrame) -> RegimeResult:
-    adx_val = adx(df, 14).iloc[-1]
-    ema50 = ema(df["close"], 50)
-    slope = (ema50.iloc[-1] - ema50.iloc[-5]) / ema50.iloc[-5]
-    width = bb_width(df, period=20, std=2.0).iloc[-1]
-    atr_series = atr(df, 14)
-    atr_z = float(((atr_series - atr_series.mean()) / atr_series.std(ddof=0)).iloc[-1])
+def detect_regime(df: pd.DataFrame, bundle: IndicatorBundle | None = None) -> RegimeResult:
+    if bundle is None:
+        bundle = IndicatorBundle(df)
+    # Scalar reads go through the numpy arrays to skip pandas' indexer overhead.
+    adx_val = bundle.adx14.to_numpy()[-1]
+    ema50 = bundle.ema50.to_numpy()
+    slope = (ema50[-1] - ema50[-5]) / ema50[-5]
+    width = bundle.bb_width20.to_numpy()[-1]
+    atr_values = bundle.atr14.to_numpy()
+    with np.errstate(divide="ignore", invalid="ignore"):
+        atr_z = float((atr_values[-1] - atr_values.mean()) / atr_values.std())
 
     meta = {
         "adx": float(adx_val),
@@ -37,3 +41,29 @@ def detect_regime(df: pd.DataFrame) -> RegimeResult:
     if np.isnan(atr_z) or abs(atr_z) > 2.5:
         return RegimeResult("CHAOTIC", meta)
     return RegimeResult("TRANSITION", meta)
+
+
+def regime_series(df: pd.DataFrame, bundle: IndicatorBundle | None = None) -> pd.Series:
+    """Regime label for every row, equivalent to ``detect_regime(df.iloc[: i + 1])``."""
+    if bundle is None:
+        bundle = IndicatorBundle(df)
+    adx_val = bundle.adx14
+    ema50 = bundle.ema50
+    prev = ema50.shift(4)
+    slope = (ema50 - prev) / prev
+    width = bundle.bb_width20
+    atr_series = bundle.atr14
+    expanding = atr_series.expanding()
+    atr_z = (atr_series - expanding.mean()) / expanding.std(ddof=0)
+
+    abs_slope = slope.abs()
+    labels = np.select(
+        [
+            (adx_val >= 25) & (abs_slope > 0.002),
+            (width < 0.05) & (abs_slope <= 0.002),
+            atr_z.isna() | (atr_z.abs() > 2.5),
+        ],
+        ["TREND_CLEAN", "RANGE", "CHAOTIC"],
+        default="TRANSITION",
+    )
+    return pd.Series(labels, index=df.index)
@@ -6,10 +6,12 @@ import sys
 from loguru import logger
 
 
-def configure_logging(json_logs: bool) -> None:
+def configure_logging(json_logs: bool, level: str = "INFO") -> None:
+    # loguru drops records below every sink's level before formatting them,
+    # so DEBUG calls on hot paths cost almost nothing at the default level.
     logger.remove()
     if json_logs:
-        logger.add(sys.stdout, serialize=True)
+        logger.add(sys.stdout, serialize=True, level=level)
     else:
-        logger.add(sys.stdout, format="{time} | {level} | {message}")
+        logger.add(sys.stdout, format="{time} | {level} | {message}", level=level)
 
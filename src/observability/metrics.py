@@ -2,11 +2,12 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import Sequence
 
 import numpy as np
 
 
-@dataclass
+@dataclass(slots=True)
 class PerformanceMetrics:
     winrate: float
     expectancy: float
@@ -14,16 +15,13 @@ class PerformanceMetrics:
     sharpe: float
 
 
-def compute_metrics(pnls: list[float]) -> PerformanceMetrics:
-    if not pnls:
+def compute_metrics(pnls: Sequence[float] | np.ndarray) -> PerformanceMetrics:
+    values = np.asarray(pnls, dtype=np.float64)
+    if values.size == 0:
         return PerformanceMetrics(0.0, 0.0, 0.0, 0.0)
-    wins = [p for p in pnls if p > 0]
-    losses = [p for p in pnls if p <= 0]
-    winrate = len(wins) / len(pnls)
-    expectancy = float(np.mean(pnls))
-    cumulative = np.cumsum(pnls)
-    peak = np.maximum.accumulate(cumulative)
-    drawdown = float(np.min(cumulative - peak)) if len(cumulative) > 0 else 0.0
-    sharpe = float(np.mean(pnls) / (np.std(pnls) + 1e-9))
+    winrate = float(np.count_nonzero(values > 0) / values.size)
+    expectancy = float(values.mean())
+    cumulative = np.cumsum(values)
+    drawdown = float((cumulative - np.maximum.accumulate(cumulative)).min())
+    sharpe = float(expectancy / (values.std() + 1e-9))
     return PerformanceMetrics(winrate, expectancy, drawdown, sharpe)
-
@@ -1,8 +1,9 @@
 """Hard risk rules and limits."""
 from __future__ import annotations
 
+import heapq
 from dataclasses import dataclass, field
-from typing import Dict
+from typing import Any, Dict
 
 
 @dataclass
@@ -13,8 +14,17 @@ class RiskRules:
 
     daily_loss_r: float = 0.0
     positions_open: int = 0
-    cooldowns: Dict[str, int] = field(default_factory=dict)
     kill_switch: bool = False
+    cycle: int = 0
+    # Cooldowns are stored as the cycle they end on, with a min-heap of deadlines,
+    # so tick() only touches expiring entries and expired symbols are dropped.
+    _cooldown_until: Dict[str, int] = field(default_factory=dict, repr=False)
+    _cooldown_heap: list[tuple[int, str]] = field(default_factory=list, repr=False)
+
+    @property
+    def cooldowns(self) -> Dict[str, int]:
+        """Remaining cooldown candles per symbol still cooling down."""
+        return {symbol: until - self.cycle for symbol, until in self._cooldown_until.items()}
 
     def register_trade_result(self, pnl_r: float) -> None:
         self.daily_loss_r += min(0.0, pnl_r)
@@ -26,14 +36,45 @@ class RiskRules:
             return False
         if self.positions_open >= self.max_positions:
             return False
-        if self.cooldowns.get(symbol, 0) > 0:
+        if self._cooldown_until.get(symbol, self.cycle) > self.cycle:
             return False
         return True
 
     def tick(self) -> None:
-        for symbol in list(self.cooldowns.keys()):
-            self.cooldowns[symbol] = max(0, self.cooldowns[symbol] - 1)
+        self.cycle += 1
+        heap = self._cooldown_heap
+        while heap and heap[0][0] <= self.cycle:
+            until, symbol = heapq.heappop(heap)
+            # A re-applied cooldown leaves a stale, earlier deadline behind; skip it.
+            if self._cooldown_until.get(symbol) == until:
+                del self._cooldown_until[symbol]
+
+    def state(self) -> dict[str, Any]:
+        """Counters worth keeping across restarts; open positions are re-read from storage."""
+        return {
+            "daily_loss_r": self.daily_loss_r,
+            "kill_switch": self.kill_switch,
+            "cooldowns": self.cooldowns,
+        }
+
+    def restore(self, state: dict[str, Any], same_day: bool = True) -> None:
+        """Load a :meth:`state` snapshot.
+
+        Daily loss and the kill switch only carry over within the same day.
+        """
+        if same_day:
+            self.daily_loss_r = float(state.get("daily_loss_r", 0.0))
+            self.kill_switch = bool(state.get("kill_switch", False))
+        for symbol, left in state.get("cooldowns", {}).items():
+            self._set_cooldown(symbol, int(left))
 
     def apply_cooldown(self, symbol: str) -> None:
-        self.cooldowns[symbol] = self.cooldown_candles
+        self._set_cooldown(symbol, self.cooldown_candles)
 
+    def _set_cooldown(self, symbol: str, candles: int) -> None:
+        if candles <= 0:
+            self._cooldown_until.pop(symbol, None)
+            return
+        until = self.cycle + candles
+        self._cooldown_until[symbol] = until
+        heapq.heappush(self._cooldown_heap, (until, symbol))
@@ -3,8 +3,10 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+import numpy as np
 
-@dataclass
+
+@dataclass(slots=True)
 class PositionSize:
     qty: float
     risk_amount: float
@@ -18,3 +20,12 @@ def position_size(equity: float, risk_pct: float, entry: float, stop: float) ->
     qty = risk_amount / risk_per_unit
     return PositionSize(qty=qty, risk_amount=risk_amount)
 
+
+def position_size_arrays(
+    equity: float, risk_pct: float, entries: np.ndarray, stops: np.ndarray
+) -> np.ndarray:
+    """Array version of :func:`position_size`, returning the quantities (0 where entry == stop)."""
+    risk_per_unit = np.abs(entries - stops)
+    qty = np.zeros_like(risk_per_unit)
+    np.divide(equity * risk_pct, risk_per_unit, out=qty, where=risk_per_unit != 0)
+    return qty
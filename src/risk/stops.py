@@ -3,19 +3,34 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+import numpy as np
 
-@dataclass
+
+@dataclass(slots=True)
 class Stops:
     stop: float
     take: float
 
 
 def atr_stops(entry: float, atr_value: float, direction: str, stop_mult: float, take_mult: float) -> Stops:
-    if direction == "LONG":
-        stop = entry - atr_value * stop_mult
-        take = entry + atr_value * take_mult
-    else:
-        stop = entry + atr_value * stop_mult
-        take = entry - atr_value * take_mult
-    return Stops(stop=stop, take=take)
+    # The direction only flips the sign, so both sides share one straight-line formula.
+    sign = 1.0 if direction == "LONG" else -1.0
+    return Stops(
+        stop=entry - sign * atr_value * stop_mult, take=entry + sign * atr_value * take_mult
+    )
+
+
+def atr_stops_arrays(
+    entries: np.ndarray,
+    atr_values: np.ndarray,
+    is_long: np.ndarray,
+    stop_mult: float,
+    take_mult: float,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Array version of :func:`atr_stops`, returning ``(stops, takes)``."""
+    stop_offset = atr_values * stop_mult
+    take_offset = atr_values * take_mult
+    stops = np.where(is_long, entries - stop_offset, entries + stop_offset)
+    takes = np.where(is_long, entries + take_offset, entries - take_offset)
+    return stops, takes
 
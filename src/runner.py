@@ -2,9 +2,12 @@
 from __future__ import annotations
 
 import time
+from collections import Counter
+from dataclasses import asdict
 from datetime import datetime, timezone
-from typing import Any, Iterable
+from typing import Any, Sequence
 
+import numpy as np
 import pandas as pd
 from loguru import logger
 
@@ -14,7 +17,9 @@ from data.collector import CandleCollector
 from data.universe import UniverseBuilder
 from exchange.base import ExchangeClient
 from exchange.binance_futures import BinanceFuturesClient
-from execution.paper import simulate_trade
+from exchange.binance_ws import KlineFeed
+from execution.paper import simulate_trade, simulate_trades
+from execution.positions import OpenPositions
 from market.clusters import build_clusters
 from market.quality import market_quality_score
 from market.regime import detect_regime
@@ -28,7 +33,7 @@ from strategy.breakout_donchian import BreakoutDonchianStrategy
 from strategy.ensemble import ensemble
 from strategy.mean_reversion_bb import MeanReversionBBStrategy
 from strategy.trend_ema import TrendEmaStrategy
-from strategy.indicators import atr
+from strategy.indicators import IndicatorBundle, cached_bundle
 
 
 class TradingRunner:
@@ -52,11 +57,13 @@ class TradingRunner:
         self.adaptive_state = AdaptiveState()
 
     def run_once(self, symbol: str, df: pd.DataFrame, btc_df: pd.DataFrame) -> None:
-        regime = detect_regime(df)
-        btc_state = detect_btc_state(btc_df, self.settings.btc_state)
+        bundle = IndicatorBundle(df)
+        btc_bundle = bundle if btc_df is df else IndicatorBundle(btc_df)
+        regime = detect_regime(df, bundle)
+        btc_state = detect_btc_state(btc_df, self.settings.btc_state, btc_bundle)
         spread = 0.001
         liquidity = 1e8
-        quality = market_quality_score(df, spread, liquidity, self.settings.market_quality)
+        quality = market_quality_score(df, spread, liquidity, self.settings.market_quality, bundle)
 
         decision = ensemble(
             symbol,
@@ -66,6 +73,7 @@ class TradingRunner:
             btc_state.state,
             quality.score,
             self.settings,
+            bundle,
         )
 
         if decision.signal.direction == "NONE":
@@ -76,7 +84,7 @@ class TradingRunner:
             logger.info("risk_block symbol={}", symbol)
             return
 
-        atr_value = atr(df, 14).iloc[-1]
+        atr_value = bundle.atr14.iat[-1]
         stops = atr_stops(
             entry=decision.signal.price,
             atr_value=atr_value,
@@ -87,14 +95,13 @@ class TradingRunner:
         risk_pct = adjust_risk(self.settings.risk.risk_per_trade_pct, self.adaptive_state)
         size = position_size(1000.0, risk_pct, decision.signal.price, stops.stop)
 
-        candle = df.iloc[-1]
         trade = simulate_trade(
             decision.signal.direction,
             decision.signal.price,
             stops.stop,
             stops.take,
-            candle_high=float(candle["high"]),
-            candle_low=float(candle["low"]),
+            candle_high=float(df["high"].iat[-1]),
+            candle_low=float(df["low"].iat[-1]),
             fee_rate=self.settings.risk.fee_rate,
             worst_case_same_candle=self.settings.execution.worst_case_same_candle,
         )
@@ -106,17 +113,32 @@ class TradingRunner:
             trade.pnl_pct,
         )
 
-    def loop(self) -> None:
-        logger.info("runner_start")
-        while True:
-            time.sleep(self.settings.runner.loop_seconds)
+
+_CANDLE_DTYPES = {
+    "open_time_ms": np.int64,
+    "open": np.float64,
+    "high": np.float64,
+    "low": np.float64,
+    "close": np.float64,
+    "volume": np.float64,
+    "close_time_ms": np.int64,
+}
 
 
-def _rows_to_df(rows: Iterable[Any]) -> pd.DataFrame:
+def _rows_to_df(rows: Sequence[Any]) -> pd.DataFrame:
     if not rows:
         return pd.DataFrame()
-    df = pd.DataFrame([dict(row) for row in rows])
-    return df.sort_values("open_time_ms").reset_index(drop=True)
+    # fetch_recent_candles returns newest first, so reversing replaces the sort;
+    # columns are built directly instead of going through one dict per row.
+    columns = zip(*reversed(rows))
+    return pd.DataFrame(
+        {
+            key: np.fromiter(values, dtype=_CANDLE_DTYPES[key], count=len(rows))
+            if key in _CANDLE_DTYPES
+            else list(values)
+            for key, values in zip(rows[0].keys(), columns)
+        }
+    )
 
 
 def _calculate_spread_liquidity(ticker: dict[str, Any] | None) -> tuple[float, float]:
@@ -133,6 +155,78 @@ def _now_ms() -> int:
     return int(time.time() * 1000)
 
 
+def _latest_closed_open_time(df: pd.DataFrame, now_ms: int) -> int | None:
+    """Open time of the newest candle in ``df`` that has closed by ``now_ms``."""
+    closed = int(np.searchsorted(df["close_time_ms"].to_numpy(), now_ms, side="right"))
+    return int(df["open_time_ms"].iat[closed - 1]) if closed else None
+
+
+_RISK_STATE_NAME = "live"
+
+
+def _load_risk_state(repo: SQLiteRepository, risk_rules: RiskRules) -> AdaptiveState:
+    """Restore risk counters saved by a previous run and return its adaptive state."""
+    stored = repo.fetch_risk_state(_RISK_STATE_NAME)
+    if stored is None:
+        return AdaptiveState()
+    day, state = stored
+    today = datetime.now(timezone.utc).date().isoformat()
+    risk_rules.restore(state["rules"], same_day=day == today)
+    return AdaptiveState(**state["adaptive"])
+
+
+def _save_risk_state(
+    repo: SQLiteRepository, risk_rules: RiskRules, adaptive_state: AdaptiveState
+) -> None:
+    repo.store_risk_state(
+        _RISK_STATE_NAME,
+        datetime.now(timezone.utc).date().isoformat(),
+        {"rules": risk_rules.state(), "adaptive": asdict(adaptive_state)},
+        _now_ms(),
+    )
+
+
+def _bundle_key(symbol: str, timeframe: str, df: pd.DataFrame) -> tuple[Any, ...]:
+    # The last close is part of the key because the newest row may be a candle still forming.
+    return (symbol, timeframe, len(df), int(df["open_time_ms"].iat[-1]), float(df["close"].iat[-1]))
+
+
+def _sync_cycle_candles(
+    collector: CandleCollector,
+    feed: KlineFeed | None,
+    symbols: list[str],
+    timeframe: str,
+    candle_limit: int,
+    backfilled: set[str],
+) -> dict[str, int]:
+    """Bring stored candles up to date and return the new-candle count per symbol.
+
+    Without a feed every symbol is polled over REST. With one, REST only
+    backfills symbols not yet covered by the stream; afterwards candles arrive
+    through the websocket.
+    """
+    if feed is None:
+        return collector.sync_candles_batch(symbols, timeframe=timeframe, limit=candle_limit)
+
+    # Subscribe before the REST pass so no candle falls between the two. A changed
+    # universe reconnects the stream, so a symbol that left and came back is
+    # backfilled again, as is everything after a stream error.
+    resubscribed = feed.subscribe(symbols, timeframe)
+    if feed.take_gap() or resubscribed:
+        backfilled.clear()
+    new_counts = dict.fromkeys(symbols, 0)
+    fresh = [symbol for symbol in symbols if symbol not in backfilled]
+    if fresh:
+        new_counts.update(
+            collector.sync_candles_batch(fresh, timeframe=timeframe, limit=candle_limit)
+        )
+        backfilled.update(fresh)
+    for symbol, candles in feed.drain().items():
+        if symbol in new_counts:
+            new_counts[symbol] += collector.store_candles(symbol, timeframe, candles)
+    return new_counts
+
+
 def _resolve_universe(
     symbols_override: list[str] | None,
     exchange: ExchangeClient,
@@ -168,7 +262,10 @@ def _resolve_universe(
 
     tickers = exchange.fetch_tickers() or {}
     btc_symbol = "BTC/USDT"
-    collector.sync_candles(btc_symbol, timeframe=timeframe, limit=candle_limit)
+    # BTC rides along in the same concurrent batch instead of its own round-trip.
+    collector.sync_candles_batch(
+        list(dict.fromkeys([btc_symbol, *symbols])), timeframe=timeframe, limit=candle_limit
+    )
     btc_rows = repo.fetch_recent_candles(btc_symbol, timeframe, candle_limit)
     btc_df = _rows_to_df(btc_rows)
     if btc_df.empty:
@@ -176,7 +273,6 @@ def _resolve_universe(
         return []
     symbol_candles: dict[str, pd.DataFrame] = {}
     for symbol in symbols:
-        collector.sync_candles(symbol, timeframe=timeframe, limit=candle_limit)
         rows = repo.fetch_recent_candles(symbol, timeframe, candle_limit)
         df = _rows_to_df(rows)
         if not df.empty:
@@ -219,240 +315,326 @@ def run_live(
         max_symbols = settings.universe.max_symbols
 
     symbols_override = symbols[:max_symbols] if symbols else None
+    feed = None
+    if settings.live.use_websocket and not once:
+        feed = KlineFeed(settings.binance_api_key, settings.binance_api_secret)
+    backfilled: set[str] = set()
     last_processed: dict[str, int] = {}
-    adaptive_state = AdaptiveState()
+    cluster_key: tuple[tuple[str, int | None], ...] | None = None
+    clusters: dict[str, int] = {}
+    strategies = [
+        TrendEmaStrategy(),
+        BreakoutDonchianStrategy(),
+        MeanReversionBBStrategy(),
+    ]
     risk_rules = RiskRules(
         max_daily_loss_r=settings.risk.max_daily_loss_r,
         max_positions=settings.risk.max_positions,
         cooldown_candles=settings.risk.cooldown_candles,
     )
-
-    while True:
-        cycle_id = _now_ms()
-        logger.info("live_cycle_start cycle_id={} timeframe={}", cycle_id, timeframe)
-
-        universe = _resolve_universe(
-            symbols_override=symbols_override,
-            exchange=exchange,
-            collector=collector,
-            repo=repo,
-            settings=settings,
-            timeframe=timeframe,
-            candle_limit=candle_limit,
-        )
-        if symbols_override is None and max_symbols:
-            universe = universe[:max_symbols]
-
-        tickers = exchange.fetch_tickers() or {}
-        btc_symbol = "BTC/USDT"
-        collector.sync_candles(btc_symbol, timeframe=timeframe, limit=candle_limit)
-        btc_rows = repo.fetch_recent_candles(btc_symbol, timeframe, candle_limit)
-        btc_df = _rows_to_df(btc_rows)
-
-        open_positions = repo.get_open_positions()
-        open_by_symbol: dict[str, list[Any]] = {}
-        for row in open_positions:
-            open_by_symbol.setdefault(row["symbol"], []).append(row)
-        risk_rules.positions_open = len(open_positions)
-
-        returns_by_symbol: dict[str, pd.Series] = {}
-        candle_frames: dict[str, pd.DataFrame] = {}
-        for symbol in universe:
-            new_count = collector.sync_candles(symbol, timeframe=timeframe, limit=candle_limit)
-            rows = repo.fetch_recent_candles(symbol, timeframe, candle_limit)
-            df = _rows_to_df(rows)
-            if df.empty:
-                continue
-            candle_frames[symbol] = df
-            returns_by_symbol[symbol] = pd.Series(df["close"]).pct_change().dropna()
-            logger.info(
-                "candles_ingested symbol={} timeframe={} rows={} new={}",
-                symbol,
+    # Losses, kill switch and cooldowns survive restarts instead of starting from zero.
+    adaptive_state = _load_risk_state(repo, risk_rules)
+
+    # Settings do not change during a run; bind the per-symbol ones to locals once.
+    risk_settings = settings.risk
+    fee_rate = risk_settings.fee_rate
+    risk_per_trade_pct = risk_settings.risk_per_trade_pct
+    stop_mult = risk_settings.stop_atr_mult
+    take_mult = risk_settings.take_atr_mult
+    max_positions_per_cluster = risk_settings.max_positions_per_cluster
+    worst_case = settings.execution.worst_case_same_candle
+    entry_on = settings.execution.entry_on
+
+    # Cycles are paced against monotonic deadlines, so time spent inside a cycle
+    # does not push every later poll back.
+    next_deadline = time.monotonic()
+    try:
+        while True:
+            next_deadline += loop_seconds
+            cycle_id = _now_ms()
+            logger.info("live_cycle_start cycle_id={} timeframe={}", cycle_id, timeframe)
+
+            universe = _resolve_universe(
+                symbols_override=symbols_override,
+                exchange=exchange,
+                collector=collector,
+                repo=repo,
+                settings=settings,
+                timeframe=timeframe,
+                candle_limit=candle_limit,
+            )
+            if symbols_override is None and max_symbols:
+                universe = universe[:max_symbols]
+
+            tickers = exchange.fetch_tickers() or {}
+            btc_symbol = "BTC/USDT"
+            new_counts = _sync_cycle_candles(
+                collector,
+                feed,
+                list(dict.fromkeys([btc_symbol, *universe])),
                 timeframe,
-                len(df),
-                new_count,
+                candle_limit,
+                backfilled,
             )
-
-        clusters = {}
-        if len(returns_by_symbol) >= 2:
-            returns_df = pd.DataFrame(returns_by_symbol)
-            cluster_result = build_clusters(returns_df, settings.risk.cluster_corr_threshold)
-            clusters = cluster_result.clusters
-
-        for symbol, df in candle_frames.items():
-            latest_closed = collector.latest_closed_candle_open_time(symbol, timeframe)
-            if latest_closed is None:
-                continue
-            if last_processed.get(symbol) == latest_closed:
-                continue
-
-            ticker = tickers.get(symbol, {})
-            spread, liquidity = _calculate_spread_liquidity(ticker)
-
-            closed_df = df[df["open_time_ms"] <= latest_closed]
-            if closed_df.empty:
-                continue
-            candle = closed_df.iloc[-1]
-            last_processed[symbol] = int(candle["open_time_ms"])
-
-            # Close open positions based on the latest closed candle.
-            for trade in open_by_symbol.get(symbol, []):
-                trade_result = simulate_trade(
-                    trade["direction"],
-                    float(trade["entry_price"]),
-                    float(trade["stop_price"]),
-                    float(trade["take_price"]),
-                    candle_high=float(candle["high"]),
-                    candle_low=float(candle["low"]),
-                    fee_rate=settings.risk.fee_rate,
-                    worst_case_same_candle=settings.execution.worst_case_same_candle,
+            btc_rows = repo.fetch_recent_candles(btc_symbol, timeframe, candle_limit)
+            btc_df = _rows_to_df(btc_rows)
+            # The BTC frame is the same for every symbol, so its state is computed once per cycle.
+            btc_state = None
+            if not btc_df.empty:
+                btc_bundle = cached_bundle(_bundle_key(btc_symbol, timeframe, btc_df), btc_df)
+                btc_state = detect_btc_state(btc_df, settings.btc_state, btc_bundle)
+
+            open_by_symbol = OpenPositions.from_rows(repo.get_open_positions())
+            risk_rules.positions_open = len(open_by_symbol)
+
+            # One clock read per cycle serves the closed-candle cutoff and every signal timestamp.
+            cycle_now_ms = _now_ms()
+            candle_frames: dict[str, pd.DataFrame] = {}
+            latest_closed_by_symbol: dict[str, int | None] = {}
+            for symbol in universe:
+                new_count = new_counts[symbol]
+                rows = repo.fetch_recent_candles(symbol, timeframe, candle_limit)
+                df = _rows_to_df(rows)
+                if df.empty:
+                    continue
+                candle_frames[symbol] = df
+                # Indicators, regime, quality and clusters only change when a candle closes;
+                # the frame already holds the newest rows, so this needs no extra query.
+                latest_closed_by_symbol[symbol] = _latest_closed_open_time(df, cycle_now_ms)
+                # Per-symbol detail is DEBUG, which the configured sinks filter out before
+                # any formatting; the cycle summary below stays at INFO.
+                logger.debug(
+                    "candles_ingested symbol={} timeframe={} rows={} new={}",
+                    symbol,
+                    timeframe,
+                    len(df),
+                    new_count,
                 )
-                if trade_result.status != "OPEN":
-                    repo.close_trade(
-                        trade_id=int(trade["id"]),
-                        exit_price=float(trade_result.exit_price),
-                        exit_time_ms=int(candle["close_time_ms"]),
-                        pnl_pct=float(trade_result.pnl_pct),
-                        status=trade_result.status,
-                    )
-                    pnl_r = trade_result.pnl_pct / settings.risk.risk_per_trade_pct
-                    risk_rules.register_trade_result(pnl_r)
-                    risk_rules.apply_cooldown(symbol)
-                    risk_rules.positions_open = max(0, risk_rules.positions_open - 1)
-                    logger.info(
-                        "paper_trade_closed symbol={} status={} pnl_pct={}",
-                        symbol,
-                        trade_result.status,
-                        trade_result.pnl_pct,
-                    )
-                    open_by_symbol[symbol] = [
-                        pos for pos in open_by_symbol.get(symbol, []) if pos["id"] != trade["id"]
-                    ]
-                    if not open_by_symbol[symbol]:
-                        open_by_symbol.pop(symbol, None)
-
-            regime = detect_regime(closed_df)
-            btc_state = detect_btc_state(btc_df, settings.btc_state)
-            quality = market_quality_score(closed_df, spread, liquidity, settings.market_quality)
-
-            decision = ensemble(
-                symbol,
-                closed_df,
-                [
-                    TrendEmaStrategy(),
-                    BreakoutDonchianStrategy(),
-                    MeanReversionBBStrategy(),
-                ],
-                regime.regime,
-                btc_state.state,
-                quality.score,
-                settings,
-            )
-
-            signal_id = repo.store_signal(
-                symbol=symbol,
-                timeframe=timeframe,
-                signal_time_ms=int(candle["close_time_ms"]),
-                signal_type=decision.signal.direction,
-                price=float(decision.signal.price),
-                confidence=float(decision.signal.confidence),
-                reasons=decision.reasons,
-                created_at_ms=_now_ms(),
-            )
             logger.info(
-                "signal_generated symbol={} direction={} cycle_id={}",
-                symbol,
-                decision.signal.direction,
-                cycle_id,
+                "candles_ingested symbols={} timeframe={} new={}",
+                len(candle_frames),
+                timeframe,
+                sum(new_counts.get(symbol, 0) for symbol in candle_frames),
             )
 
-            if decision.signal.direction == "NONE":
-                continue
-
-            if symbol in open_by_symbol:
-                logger.info("risk_block_open_position symbol={}", symbol)
-                continue
-
-            if not risk_rules.can_open(symbol):
-                logger.info("risk_block symbol={}", symbol)
-                continue
-
-            cluster_id = clusters.get(symbol)
-            if cluster_id is not None:
-                cluster_positions = sum(
-                    1
-                    for sym in open_by_symbol
-                    if clusters.get(sym) == cluster_id
-                )
-                if cluster_positions >= settings.risk.max_positions_per_cluster:
-                    logger.info("risk_block_cluster symbol={} cluster={}", symbol, cluster_id)
-                    continue
+            # The correlation matrix is O(symbols^2 * candles); rebuild it only when the
+            # universe changes or one of its candles closes.
+            key = tuple(latest_closed_by_symbol.items())
+            if key != cluster_key:
+                cluster_key = key
+                clusters = {}
+                if len(candle_frames) >= 2:
+                    returns_by_symbol = {}
+                    for symbol, df in candle_frames.items():
+                        closes = df["close"].to_numpy()
+                        returns_by_symbol[symbol] = closes[1:] / closes[:-1] - 1.0
+                    # Series wrappers let frames of different lengths align, as pct_change did.
+                    returns_df = pd.DataFrame(
+                        {sym: pd.Series(values) for sym, values in returns_by_symbol.items()}
+                    )
+                    cluster_result = build_clusters(
+                        returns_df, settings.risk.cluster_corr_threshold
+                    )
+                    clusters = cluster_result.clusters
+            # Symbols with open positions per cluster, kept in step as positions open and close.
+            cluster_counts = Counter(clusters.get(sym) for sym in open_by_symbol)
+
+            # One commit for every signal and trade written this cycle.
+            with repo.transaction():
+                for symbol, df in candle_frames.items():
+                    latest_closed = latest_closed_by_symbol[symbol]
+                    if latest_closed is None:
+                        continue
+                    if last_processed.get(symbol) == latest_closed:
+                        continue
+
+                    ticker = tickers.get(symbol, {})
+                    spread, liquidity = _calculate_spread_liquidity(ticker)
+
+                    # open_time_ms is ascending, so a binary search replaces the full boolean mask.
+                    closed_end = int(
+                        np.searchsorted(df["open_time_ms"].to_numpy(), latest_closed, side="right")
+                    )
+                    closed_df = df.iloc[:closed_end]
+                    if closed_df.empty:
+                        continue
+                    # Scalar reads off the columns avoid materializing the row as a Series.
+                    last = closed_end - 1
+                    last_processed[symbol] = int(df["open_time_ms"].iat[last])
+                    candle_close_time = int(df["close_time_ms"].iat[last])
+
+                    # Close open positions based on the latest closed candle, resolving all of
+                    # the symbol's trades in one vectorized pass.
+                    rows = open_by_symbol.rows(symbol)
+                    if len(rows):
+                        statuses, exit_prices, pnl_pcts = simulate_trades(
+                            open_by_symbol.directions[rows],
+                            open_by_symbol.entry_prices[rows],
+                            open_by_symbol.stop_prices[rows],
+                            open_by_symbol.take_prices[rows],
+                            float(df["high"].iat[last]),
+                            float(df["low"].iat[last]),
+                            worst_case_same_candle=worst_case,
+                        )
+                        for i in np.flatnonzero(statuses != "OPEN").tolist():
+                            row = int(rows[i])
+                            status = str(statuses[i])
+                            pnl_pct = float(pnl_pcts[i])
+                            repo.close_trade(
+                                trade_id=int(open_by_symbol.ids[row]),
+                                exit_price=float(exit_prices[i]),
+                                exit_time_ms=candle_close_time,
+                                pnl_pct=pnl_pct,
+                                status=status,
+                            )
+                            pnl_r = pnl_pct / risk_per_trade_pct
+                            risk_rules.register_trade_result(pnl_r)
+                            risk_rules.apply_cooldown(symbol)
+                            risk_rules.positions_open = max(0, risk_rules.positions_open - 1)
+                            logger.info(
+                                "paper_trade_closed symbol={} status={} pnl_pct={}",
+                                symbol,
+                                status,
+                                pnl_pct,
+                            )
+                            open_by_symbol.close(symbol, row)
+                        if symbol not in open_by_symbol:
+                            cluster_counts[clusters.get(symbol)] -= 1
+
+                    if btc_state is None:
+                        logger.warning("btc_state_missing symbol={}", symbol)
+                        continue
+
+                    # Bundles are keyed on the last candle, so a symbol's indicators are
+                    # reused until a new candle arrives.
+                    bundle = cached_bundle(_bundle_key(symbol, timeframe, closed_df), closed_df)
+                    regime = detect_regime(closed_df, bundle)
+                    quality = market_quality_score(
+                        closed_df, spread, liquidity, settings.market_quality, bundle
+                    )
 
-            if settings.execution.entry_on == "next_open":
-                next_candle = df[df["open_time_ms"] > latest_closed].head(1)
-                if next_candle.empty:
-                    logger.info("await_next_open symbol={}", symbol)
-                    continue
-                entry_price = float(next_candle.iloc[0]["open"])
-            else:
-                entry_price = float(candle["close"])
-
-            atr_value = atr(closed_df, 14).iloc[-1]
-            stops = atr_stops(
-                entry=entry_price,
-                atr_value=atr_value,
-                direction=decision.signal.direction,
-                stop_mult=settings.risk.stop_atr_mult,
-                take_mult=settings.risk.take_atr_mult,
-            )
-            risk_pct = adjust_risk(settings.risk.risk_per_trade_pct, adaptive_state)
-            size = position_size(1000.0, risk_pct, entry_price, stops.stop)
-
-            trade_id = repo.open_trade(
-                signal_id=signal_id,
-                direction=decision.signal.direction,
-                entry_price=entry_price,
-                stop_price=stops.stop,
-                take_price=stops.take,
-                fees_estimate=settings.risk.fee_rate * 2,
-                meta={
-                    "entry_on": settings.execution.entry_on,
-                    "cycle_id": cycle_id,
-                    "size": size,
-                },
-            )
-            risk_rules.positions_open += 1
-            open_by_symbol.setdefault(symbol, []).append(
-                {
-                    "id": trade_id,
-                    "symbol": symbol,
-                    "direction": decision.signal.direction,
-                    "entry_price": entry_price,
-                    "stop_price": stops.stop,
-                    "take_price": stops.take,
-                }
-            )
-            logger.info(
-                "paper_trade_opened symbol={} trade_id={} direction={} entry_price={}",
-                symbol,
-                trade_id,
-                decision.signal.direction,
-                entry_price,
-            )
+                    decision = ensemble(
+                        symbol,
+                        closed_df,
+                        strategies,
+                        regime.regime,
+                        btc_state.state,
+                        quality.score,
+                        settings,
+                        bundle,
+                    )
 
-        risk_rules.tick()
+                    signal_id = repo.store_signal(
+                        symbol=symbol,
+                        timeframe=timeframe,
+                        signal_time_ms=candle_close_time,
+                        signal_type=decision.signal.direction,
+                        price=float(decision.signal.price),
+                        confidence=float(decision.signal.confidence),
+                        reasons=decision.reasons,
+                        created_at_ms=cycle_now_ms,
+                    )
+                    logger.info(
+                        "signal_generated symbol={} direction={} cycle_id={}",
+                        symbol,
+                        decision.signal.direction,
+                        cycle_id,
+                    )
 
-        if once:
-            logger.info("live_cycle_complete cycle_id={}", cycle_id)
-            break
+                    if decision.signal.direction == "NONE":
+                        continue
+
+                    if symbol in open_by_symbol:
+                        logger.info("risk_block_open_position symbol={}", symbol)
+                        continue
+
+                    if not risk_rules.can_open(symbol):
+                        logger.info("risk_block symbol={}", symbol)
+                        continue
+
+                    cluster_id = clusters.get(symbol)
+                    if (
+                        cluster_id is not None
+                        and cluster_counts[cluster_id] >= max_positions_per_cluster
+                    ):
+                        logger.info("risk_block_cluster symbol={} cluster={}", symbol, cluster_id)
+                        continue
+
+                    if entry_on == "next_open":
+                        if closed_end == len(df):
+                            logger.info("await_next_open symbol={}", symbol)
+                            continue
+                        entry_price = float(df["open"].iat[closed_end])
+                    else:
+                        entry_price = float(df["close"].iat[last])
+
+                    atr_value = bundle.atr14.iat[-1]
+                    stops = atr_stops(
+                        entry=entry_price,
+                        atr_value=atr_value,
+                        direction=decision.signal.direction,
+                        stop_mult=stop_mult,
+                        take_mult=take_mult,
+                    )
+                    risk_pct = adjust_risk(risk_per_trade_pct, adaptive_state)
+                    size = position_size(1000.0, risk_pct, entry_price, stops.stop)
+
+                    trade_id = repo.open_trade(
+                        signal_id=signal_id,
+                        direction=decision.signal.direction,
+                        entry_price=entry_price,
+                        stop_price=stops.stop,
+                        take_price=stops.take,
+                        fees_estimate=fee_rate * 2,
+                        meta={
+                            "entry_on": entry_on,
+                            "cycle_id": cycle_id,
+                            "size": size,
+                        },
+                    )
+                    risk_rules.positions_open += 1
+                    cluster_counts[cluster_id] += 1
+                    open_by_symbol.add(
+                        trade_id,
+                        symbol,
+                        decision.signal.direction,
+                        entry_price,
+                        stops.stop,
+                        stops.take,
+                    )
+                    logger.info(
+                        "paper_trade_opened symbol={} trade_id={} direction={} entry_price={}",
+                        symbol,
+                        trade_id,
+                        decision.signal.direction,
+                        entry_price,
+                    )
 
-        time.sleep(loop_seconds)
+            risk_rules.tick()
+            # Saved once per cycle rather than on every change.
+            _save_risk_state(repo, risk_rules, adaptive_state)
+
+            if once:
+                logger.info("live_cycle_complete cycle_id={}", cycle_id)
+                break
+
+            remaining = max(0.0, next_deadline - time.monotonic())
+            if feed is not None:
+                # Wake as soon as a candle closes and restart the schedule from there.
+                if feed.wait_for_close(remaining):
+                    next_deadline = time.monotonic()
+            elif remaining:
+                time.sleep(remaining)
+            # After an overrun, start again from now instead of firing back-to-back cycles.
+            next_deadline = max(next_deadline, time.monotonic())
+    finally:
+        if feed is not None:
+            # Stops the stream task, the ccxt.pro client and its event-loop thread.
+            feed.close()
 
 
 def main() -> None:
-    settings = Settings.load()
-    runner = TradingRunner(settings)
-    logger.info("runner_ready")
+    run_live(settings=Settings.load())
 
 
 if __name__ == "__main__":
@@ -3,20 +3,209 @@ from __future__ import annotations
 
 import json
 import sqlite3
+import sys
 import time
-from typing import Any, Iterable
+from contextlib import contextmanager
+from operator import itemgetter
+from typing import Any, Iterable, Iterator, Sequence
+
+import pandas as pd
 
 from storage.schema import create_schema
 
+# One reusable C-accelerated encoder with compact separators for the *_json columns,
+# and the matching decoder (the columns always hold str, so no bytes sniffing).
+_dumps = json.JSONEncoder(separators=(",", ":"), check_circular=False).encode
+_loads = json.JSONDecoder().decode
+_candle_values = itemgetter(
+    "open_time_ms", "open", "high", "low", "close", "volume", "close_time_ms"
+)
+
+
+_SQL_UPSERT_CANDLES = """
+INSERT OR REPLACE INTO candles (
+  exchange, symbol, timeframe, open_time_ms, open, high, low, close, volume, close_time_ms
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_FETCH_LATEST_CANDLE_OPEN_TIME = """
+SELECT MAX(open_time_ms) AS max_time
+FROM candles
+WHERE exchange = ? AND symbol = ? AND timeframe = ?
+"""
+
+_SQL_FETCH_LATEST_CLOSED_CANDLE_OPEN_TIME = """
+SELECT MAX(open_time_ms) AS max_time
+FROM candles
+WHERE exchange = ? AND symbol = ? AND timeframe = ? AND close_time_ms <= ?
+"""
+
+_SQL_FETCH_CANDLES = """
+SELECT * FROM candles
+WHERE symbol = ? AND timeframe = ?
+ORDER BY open_time_ms DESC
+LIMIT ?
+"""
+
+_SQL_FETCH_CANDLES_FRAME = """
+SELECT * FROM (
+  SELECT * FROM candles
+  WHERE symbol = ? AND timeframe = ?
+  ORDER BY open_time_ms DESC
+  LIMIT ?
+)
+ORDER BY open_time_ms
+"""
+
+_SQL_STORE_UNIVERSE = """
+INSERT OR REPLACE INTO universe_daily (day, symbols_json, meta_json)
+VALUES (?, ?, ?)
+"""
+
+_SQL_FETCH_UNIVERSE = """
+SELECT symbols_json, meta_json FROM universe_daily WHERE day = ?
+"""
+
+_SQL_STORE_BTC_STATE = """
+INSERT OR REPLACE INTO btc_state (time_ms, state, meta_json)
+VALUES (?, ?, ?)
+"""
+
+_SQL_STORE_MARKET_QUALITY = """
+INSERT OR REPLACE INTO market_quality (time_ms, symbol, score, meta_json)
+VALUES (?, ?, ?, ?)
+"""
+
+_SQL_STORE_SIGNAL = """
+INSERT INTO signals (
+  symbol, timeframe, signal_time_ms, type, price, confidence, reasons_json, created_at_ms
+)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_STORE_TRADE_SIMULATED = """
+INSERT INTO trades_simulated (
+  signal_id, direction, entry_price, stop_price, take_price, status, exit_time_ms,
+  exit_price, pnl_pct, fees_estimate, meta_json
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_CLOSE_TRADE = """
+UPDATE trades_simulated
+SET status = ?, exit_time_ms = ?, exit_price = ?, pnl_pct = ?
+WHERE id = ?
+"""
+
+_SQL_GET_OPEN_POSITIONS = """
+SELECT trades_simulated.*, signals.symbol
+FROM trades_simulated
+JOIN signals ON signals.id = trades_simulated.signal_id
+WHERE trades_simulated.status = 'OPEN'
+"""
+
+_SQL_STORE_STRATEGY_PERFORMANCE = """
+INSERT OR REPLACE INTO strategy_performance (
+  strategy_name, symbol, window_trades, expectancy, winrate, dd, enabled, updated_at_ms
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_STORE_METRICS_DAILY = """
+INSERT OR REPLACE INTO metrics_daily (
+  day, trades_count, winrate, expectancy, max_drawdown, updated_at_ms
+)
+VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_STORE_RISK_STATE = """
+INSERT OR REPLACE INTO risk_state (name, day, state_json, updated_at_ms)
+VALUES (?, ?, ?, ?)
+"""
+
+_SQL_FETCH_RISK_STATE = """
+SELECT day, state_json FROM risk_state WHERE name = ?
+"""
+
 
 class SQLiteRepository:
     """Thin repository for SQLite storage."""
 
     def __init__(self, db_path: str) -> None:
         self.db_path = db_path
-        self._conn = sqlite3.connect(self.db_path)
+        # Autocommit at the driver level: transactions are opened explicitly with
+        # BEGIN IMMEDIATE in transaction(), instead of sqlite3's implicit BEGIN per DML.
+        self._conn = sqlite3.connect(self.db_path, isolation_level=None)
         self._conn.row_factory = sqlite3.Row
+        # WAL lets readers (the GUI) proceed while the live loop writes; with WAL,
+        # synchronous=NORMAL only syncs at checkpoints and stays crash-safe.
+        self._conn.executescript(
+            """
+            PRAGMA journal_mode=WAL;
+            PRAGMA synchronous=NORMAL;
+            PRAGMA temp_store=MEMORY;
+            PRAGMA cache_size=-65536;
+            PRAGMA mmap_size=268435456;
+            PRAGMA analysis_limit=1000;
+            """
+        )
         create_schema(self._conn)
+        self._batch_depth = 0
+        self._pending: dict[str, list[tuple[Any, ...]]] | None = None
+
+    def close(self) -> None:
+        """Refresh planner statistics where they went stale, then close the connection."""
+        self._conn.execute("PRAGMA optimize")
+        self._conn.close()
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Group the writes made inside the block into a single commit.
+
+        Each write otherwise commits (and syncs) on its own; the live loop wraps a
+        whole cycle so it pays for one commit instead of one per symbol. Nested
+        blocks join the outermost one, which owns the BEGIN/COMMIT.
+        """
+        if self._batch_depth:
+            self._batch_depth += 1
+            try:
+                yield
+            finally:
+                self._batch_depth -= 1
+            return
+        # IMMEDIATE takes the write lock up front rather than upgrading mid-transaction.
+        self._conn.execute("BEGIN IMMEDIATE")
+        self._batch_depth = 1
+        try:
+            yield
+        except BaseException:
+            # SQLite may already have rolled back on its own (e.g. SQLITE_FULL).
+            if self._conn.in_transaction:
+                self._conn.execute("ROLLBACK")
+            raise
+        else:
+            self._conn.execute("COMMIT")
+        finally:
+            self._batch_depth = 0
+
+    def begin_batch(self) -> None:
+        """Queue rows from the ``store_*`` methods that return nothing until :meth:`flush`."""
+        if self._pending is None:
+            self._pending = {}
+
+    def flush(self) -> None:
+        """Write queued rows with one ``executemany`` per statement and a single commit."""
+        pending, self._pending = self._pending, None
+        if not pending:
+            return
+        with self.transaction():
+            for sql, rows in pending.items():
+                self._conn.executemany(sql, rows)
+
+    def _write(self, sql: str, params: tuple[Any, ...]) -> None:
+        if self._pending is not None:
+            self._pending.setdefault(sql, []).append(params)
+            return
+        with self.transaction():
+            self._conn.execute(sql, params)
 
     def upsert_candles(
         self,
@@ -25,33 +214,48 @@ class SQLiteRepository:
         timeframe: str,
         rows: Iterable[dict[str, Any]],
     ) -> None:
-        with self._conn:
+        with self.transaction():
+            self._conn.executemany(
+                _SQL_UPSERT_CANDLES,
+                ((exchange, symbol, timeframe, *_candle_values(row)) for row in rows),
+            )
+
+    def upsert_ohlcv(
+        self,
+        exchange: str,
+        symbol: str,
+        timeframe: str,
+        raw: Iterable[Sequence[Any]],
+        duration_ms: int,
+    ) -> None:
+        """Upsert exchange ``[open_time, open, high, low, close, volume]`` rows as they are.
+
+        Rows are bound straight from ``raw`` as ``executemany`` consumes them; the
+        close time is the open time plus ``duration_ms``.
+        """
+        with self.transaction():
             self._conn.executemany(
-                """
-                INSERT OR REPLACE INTO candles (
-                  exchange, symbol, timeframe, open_time_ms, open, high, low, close, volume, close_time_ms
-                ) VALUES (
-                  :exchange, :symbol, :timeframe, :open_time_ms, :open, :high, :low, :close, :volume, :close_time_ms
-                )
-                """,
-                [
-                    {
-                        "exchange": exchange,
-                        "symbol": symbol,
-                        "timeframe": timeframe,
-                        **row,
-                    }
-                    for row in rows
-                ],
+                _SQL_UPSERT_CANDLES,
+                (
+                    (
+                        exchange,
+                        symbol,
+                        timeframe,
+                        open_time,
+                        open_,
+                        high,
+                        low,
+                        close,
+                        volume,
+                        open_time + duration_ms,
+                    )
+                    for open_time, open_, high, low, close, volume in raw
+                ),
             )
 
     def fetch_latest_candle_open_time(self, exchange: str, symbol: str, timeframe: str) -> int | None:
         cursor = self._conn.execute(
-            """
-            SELECT MAX(open_time_ms) AS max_time
-            FROM candles
-            WHERE exchange = ? AND symbol = ? AND timeframe = ?
-            """,
+            _SQL_FETCH_LATEST_CANDLE_OPEN_TIME,
             (exchange, symbol, timeframe),
         )
         row = cursor.fetchone()
@@ -61,11 +265,7 @@ class SQLiteRepository:
 
     def fetch_latest_closed_candle_open_time(self, exchange: str, symbol: str, timeframe: str) -> int | None:
         cursor = self._conn.execute(
-            """
-            SELECT MAX(open_time_ms) AS max_time
-            FROM candles
-            WHERE exchange = ? AND symbol = ? AND timeframe = ? AND close_time_ms <= ?
-            """,
+            _SQL_FETCH_LATEST_CLOSED_CANDLE_OPEN_TIME,
             (exchange, symbol, timeframe, int(time.time() * 1000)),
         )
         row = cursor.fetchone()
@@ -75,60 +275,59 @@ class SQLiteRepository:
 
     def fetch_candles(self, symbol: str, timeframe: str, limit: int = 200) -> list[sqlite3.Row]:
         cursor = self._conn.execute(
-            """
-            SELECT * FROM candles
-            WHERE symbol = ? AND timeframe = ?
-            ORDER BY open_time_ms DESC
-            LIMIT ?
-            """,
+            _SQL_FETCH_CANDLES,
             (symbol, timeframe, limit),
         )
-        return list(cursor.fetchall())
+        return cursor.fetchall()
+
+    def fetch_candles_frame(
+        self,
+        symbol: str,
+        timeframe: str,
+        limit: int = 200,
+        chunksize: int = 10_000,
+    ) -> pd.DataFrame:
+        """Return the latest ``limit`` candles as a DataFrame in ascending open time."""
+        chunks = pd.read_sql_query(
+            _SQL_FETCH_CANDLES_FRAME,
+            self._conn,
+            params=(symbol, timeframe, limit),
+            chunksize=chunksize,
+        )
+        return pd.concat(chunks, ignore_index=True)
 
     def fetch_recent_candles(self, symbol: str, timeframe: str, limit: int = 300) -> list[sqlite3.Row]:
         return self.fetch_candles(symbol, timeframe, limit)
 
     def store_universe(self, day: str, symbols: list[str], meta: dict[str, Any]) -> None:
-        with self._conn:
+        with self.transaction():
             self._conn.execute(
-                """
-                INSERT OR REPLACE INTO universe_daily (day, symbols_json, meta_json)
-                VALUES (?, ?, ?)
-                """,
-                (day, json.dumps(symbols), json.dumps(meta)),
+                _SQL_STORE_UNIVERSE,
+                (day, _dumps(symbols), _dumps(meta)),
             )
 
     def fetch_universe(self, day: str) -> tuple[list[str], dict[str, Any]] | None:
         cursor = self._conn.execute(
-            """
-            SELECT symbols_json, meta_json FROM universe_daily WHERE day = ?
-            """,
+            _SQL_FETCH_UNIVERSE,
             (day,),
         )
         row = cursor.fetchone()
         if row is None:
             return None
-        return json.loads(row["symbols_json"]), json.loads(row["meta_json"])
+        symbols = [sys.intern(symbol) for symbol in _loads(row["symbols_json"])]
+        return symbols, _loads(row["meta_json"])
 
     def store_btc_state(self, time_ms: int, state: str, meta: dict[str, Any]) -> None:
-        with self._conn:
-            self._conn.execute(
-                """
-                INSERT OR REPLACE INTO btc_state (time_ms, state, meta_json)
-                VALUES (?, ?, ?)
-                """,
-                (time_ms, state, json.dumps(meta)),
-            )
+        self._write(
+            _SQL_STORE_BTC_STATE,
+            (time_ms, state, _dumps(meta)),
+        )
 
     def store_market_quality(self, time_ms: int, symbol: str, score: int, meta: dict[str, Any]) -> None:
-        with self._conn:
-            self._conn.execute(
-                """
-                INSERT OR REPLACE INTO market_quality (time_ms, symbol, score, meta_json)
-                VALUES (?, ?, ?, ?)
-                """,
-                (time_ms, symbol, score, json.dumps(meta)),
-            )
+        self._write(
+            _SQL_STORE_MARKET_QUALITY,
+            (time_ms, symbol, score, _dumps(meta)),
+        )
 
     def store_signal(
         self,
@@ -141,23 +340,20 @@ class SQLiteRepository:
         reasons: dict[str, Any],
         created_at_ms: int,
     ) -> int:
-        cursor = self._conn.execute(
-            """
-            INSERT INTO signals (symbol, timeframe, signal_time_ms, type, price, confidence, reasons_json, created_at_ms)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                symbol,
-                timeframe,
-                signal_time_ms,
-                signal_type,
-                price,
-                confidence,
-                json.dumps(reasons),
-                created_at_ms,
-            ),
-        )
-        self._conn.commit()
+        with self.transaction():
+            cursor = self._conn.execute(
+                _SQL_STORE_SIGNAL,
+                (
+                    symbol,
+                    timeframe,
+                    signal_time_ms,
+                    signal_type,
+                    price,
+                    confidence,
+                    _dumps(reasons),
+                    created_at_ms,
+                ),
+            )
         return int(cursor.lastrowid)
 
     def store_trade_simulated(
@@ -174,28 +370,22 @@ class SQLiteRepository:
         fees_estimate: float,
         meta: dict[str, Any],
     ) -> None:
-        with self._conn:
-            self._conn.execute(
-                """
-                INSERT INTO trades_simulated (
-                  signal_id, direction, entry_price, stop_price, take_price, status, exit_time_ms,
-                  exit_price, pnl_pct, fees_estimate, meta_json
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    signal_id,
-                    direction,
-                    entry_price,
-                    stop_price,
-                    take_price,
-                    status,
-                    exit_time_ms,
-                    exit_price,
-                    pnl_pct,
-                    fees_estimate,
-                    json.dumps(meta),
-                ),
-            )
+        self._write(
+            _SQL_STORE_TRADE_SIMULATED,
+            (
+                signal_id,
+                direction,
+                entry_price,
+                stop_price,
+                take_price,
+                status,
+                exit_time_ms,
+                exit_price,
+                pnl_pct,
+                fees_estimate,
+                _dumps(meta),
+            ),
+        )
 
     def open_trade(
         self,
@@ -207,28 +397,23 @@ class SQLiteRepository:
         fees_estimate: float,
         meta: dict[str, Any],
     ) -> int:
-        cursor = self._conn.execute(
-            """
-            INSERT INTO trades_simulated (
-              signal_id, direction, entry_price, stop_price, take_price, status, exit_time_ms,
-              exit_price, pnl_pct, fees_estimate, meta_json
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                signal_id,
-                direction,
-                entry_price,
-                stop_price,
-                take_price,
-                "OPEN",
-                None,
-                None,
-                None,
-                fees_estimate,
-                json.dumps(meta),
-            ),
-        )
-        self._conn.commit()
+        with self.transaction():
+            cursor = self._conn.execute(
+                _SQL_STORE_TRADE_SIMULATED,
+                (
+                    signal_id,
+                    direction,
+                    entry_price,
+                    stop_price,
+                    take_price,
+                    "OPEN",
+                    None,
+                    None,
+                    None,
+                    fees_estimate,
+                    _dumps(meta),
+                ),
+            )
         return int(cursor.lastrowid)
 
     def close_trade(
@@ -239,26 +424,17 @@ class SQLiteRepository:
         pnl_pct: float,
         status: str,
     ) -> None:
-        with self._conn:
+        with self.transaction():
             self._conn.execute(
-                """
-                UPDATE trades_simulated
-                SET status = ?, exit_time_ms = ?, exit_price = ?, pnl_pct = ?
-                WHERE id = ?
-                """,
+                _SQL_CLOSE_TRADE,
                 (status, exit_time_ms, exit_price, pnl_pct, trade_id),
             )
 
     def get_open_positions(self) -> list[sqlite3.Row]:
         cursor = self._conn.execute(
-            """
-            SELECT trades_simulated.*, signals.symbol
-            FROM trades_simulated
-            JOIN signals ON signals.id = trades_simulated.signal_id
-            WHERE trades_simulated.status = 'OPEN'
-            """,
+            _SQL_GET_OPEN_POSITIONS,
         )
-        return list(cursor.fetchall())
+        return cursor.fetchall()
 
     def store_strategy_performance(
         self,
@@ -271,24 +447,19 @@ class SQLiteRepository:
         enabled: bool,
         updated_at_ms: int,
     ) -> None:
-        with self._conn:
-            self._conn.execute(
-                """
-                INSERT OR REPLACE INTO strategy_performance (
-                  strategy_name, symbol, window_trades, expectancy, winrate, dd, enabled, updated_at_ms
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    strategy_name,
-                    symbol,
-                    window_trades,
-                    expectancy,
-                    winrate,
-                    dd,
-                    1 if enabled else 0,
-                    updated_at_ms,
-                ),
-            )
+        self._write(
+            _SQL_STORE_STRATEGY_PERFORMANCE,
+            (
+                strategy_name,
+                symbol,
+                window_trades,
+                expectancy,
+                winrate,
+                dd,
+                1 if enabled else 0,
+                updated_at_ms,
+            ),
+        )
 
     def store_metrics_daily(
         self,
@@ -299,11 +470,26 @@ class SQLiteRepository:
         max_drawdown: float,
         updated_at_ms: int,
     ) -> None:
-        with self._conn:
+        self._write(
+            _SQL_STORE_METRICS_DAILY,
+            (day, trades_count, winrate, expectancy, max_drawdown, updated_at_ms),
+        )
+
+    def store_risk_state(
+        self, name: str, day: str, state: dict[str, Any], updated_at_ms: int
+    ) -> None:
+        with self.transaction():
             self._conn.execute(
-                """
-                INSERT OR REPLACE INTO metrics_daily (day, trades_count, winrate, expectancy, max_drawdown, updated_at_ms)
-                VALUES (?, ?, ?, ?, ?, ?)
-                """,
-                (day, trades_count, winrate, expectancy, max_drawdown, updated_at_ms),
+                _SQL_STORE_RISK_STATE,
+                (name, day, _dumps(state), updated_at_ms),
             )
+
+    def fetch_risk_state(self, name: str) -> tuple[str, dict[str, Any]] | None:
+        cursor = self._conn.execute(
+            _SQL_FETCH_RISK_STATE,
+            (name,),
+        )
+        row = cursor.fetchone()
+        if row is None:
+            return None
+        return row["day"], _loads(row["state_json"])
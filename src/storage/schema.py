@@ -18,11 +18,14 @@ CREATE TABLE IF NOT EXISTS candles (
   PRIMARY KEY (exchange, symbol, timeframe, open_time_ms)
 );
 
+CREATE INDEX IF NOT EXISTS idx_candles_sym_tf_time
+  ON candles (symbol, timeframe, open_time_ms DESC);
+
 CREATE TABLE IF NOT EXISTS universe_daily (
   day TEXT PRIMARY KEY,
   symbols_json TEXT NOT NULL,
   meta_json TEXT NOT NULL
-);
+) WITHOUT ROWID;
 
 CREATE TABLE IF NOT EXISTS btc_state (
   time_ms INTEGER PRIMARY KEY,
@@ -36,7 +39,7 @@ CREATE TABLE IF NOT EXISTS market_quality (
   score INTEGER NOT NULL,
   meta_json TEXT NOT NULL,
   PRIMARY KEY (time_ms, symbol)
-);
+) WITHOUT ROWID;
 
 CREATE TABLE IF NOT EXISTS signals (
   id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -50,6 +53,8 @@ CREATE TABLE IF NOT EXISTS signals (
   created_at_ms INTEGER NOT NULL
 );
 
+CREATE INDEX IF NOT EXISTS idx_signals_signal_time ON signals (signal_time_ms DESC);
+
 CREATE TABLE IF NOT EXISTS trades_simulated (
   id INTEGER PRIMARY KEY AUTOINCREMENT,
   signal_id INTEGER NOT NULL,
@@ -87,7 +92,14 @@ CREATE TABLE IF NOT EXISTS strategy_performance (
   enabled INTEGER NOT NULL,
   updated_at_ms INTEGER NOT NULL,
   PRIMARY KEY (strategy_name, symbol)
-);
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS risk_state (
+  name TEXT PRIMARY KEY,
+  day TEXT NOT NULL,
+  state_json TEXT NOT NULL,
+  updated_at_ms INTEGER NOT NULL
+) WITHOUT ROWID;
 
 CREATE TABLE IF NOT EXISTS metrics_daily (
   day TEXT PRIMARY KEY,
@@ -96,11 +108,15 @@ CREATE TABLE IF NOT EXISTS metrics_daily (
   expectancy REAL NOT NULL,
   max_drawdown REAL NOT NULL,
   updated_at_ms INTEGER NOT NULL
-);
+) WITHOUT ROWID;
 """
 
 
 def create_schema(conn: sqlite3.Connection) -> None:
     conn.executescript(SCHEMA_SQL)
+    # Without statistics the planner guesses on the first queries; gather them
+    # once for a new database; PRAGMA optimize keeps them fresh afterwards.
+    if conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'").fetchone() is None:
+        conn.execute("ANALYZE")
     conn.commit()
 
@@ -2,12 +2,15 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import pandas as pd
 
+if TYPE_CHECKING:
+    from strategy.indicators import IndicatorBundle
 
-@dataclass
+
+@dataclass(slots=True)
 class Signal:
     symbol: str
     direction: str  # LONG, SHORT, NONE
@@ -22,3 +25,16 @@ class Strategy:
     def generate(self, symbol: str, df: pd.DataFrame, settings: Any) -> Signal:
         raise NotImplementedError
 
+    def generate_from_bundle(self, symbol: str, bundle: IndicatorBundle, settings: Any) -> Signal:
+        """``generate`` on ``bundle.df``, reusing indicators other checks already computed."""
+        return self.generate(symbol, bundle.df, settings)
+
+    def generate_series(
+        self, df: pd.DataFrame, settings: Any, bundle: IndicatorBundle | None = None
+    ) -> pd.Series:
+        """Direction for every row, as ``generate`` would return it on ``df.iloc[: i + 1]``.
+
+        ``bundle`` (built on ``df``) lets strategies share indicator series.
+        """
+        raise NotImplementedError
+
@@ -1,37 +1,64 @@
 """Donchian breakout strategy."""
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 
 from strategy.base import Signal, Strategy
-from strategy.indicators import atr, donchian, rsi
+from strategy.indicators import IndicatorBundle, donchian, donchian_last
 
 
 class BreakoutDonchianStrategy(Strategy):
     name = "breakout_donchian"
 
     def generate(self, symbol: str, df: pd.DataFrame, settings: object) -> Signal:
-        channel = donchian(df, period=settings.donchian_period)
-        latest = df.iloc[-1]
-        rsi_val = rsi(df, 14).iloc[-1]
-        atr_series = atr(df, 14)
-        atr_z = (atr_series - atr_series.mean()) / atr_series.std(ddof=0)
-        spike = atr_z.iloc[-1] >= settings.atr_zscore_spike
+        return self.generate_from_bundle(symbol, IndicatorBundle(df), settings)
+
+    def generate_from_bundle(
+        self, symbol: str, bundle: IndicatorBundle, settings: object
+    ) -> Signal:
+        # The channel's last value only sees the last ``period`` candles; RSI and ATR
+        # are recursive (and the ATR z-score spans the whole frame), so they stay full-length.
+        channel_high, channel_low = donchian_last(bundle.df, period=settings.donchian_period)
+        close = float(bundle.close[-1])
+        rsi_val = bundle.rsi14.to_numpy()[-1]
+        atr_values = bundle.atr14.to_numpy()
+        with np.errstate(divide="ignore", invalid="ignore"):
+            atr_z = (atr_values[-1] - atr_values.mean()) / atr_values.std()
+        spike = atr_z >= settings.atr_zscore_spike
 
         reasons = {
-            "donchian_high": float(channel["high"].iloc[-1]),
-            "donchian_low": float(channel["low"].iloc[-1]),
+            "donchian_high": float(channel_high),
+            "donchian_low": float(channel_low),
             "rsi": float(rsi_val),
-            "atr_zscore": float(atr_z.iloc[-1]),
+            "atr_zscore": float(atr_z),
             "spike": bool(spike),
         }
 
         if spike:
-            return Signal(symbol, "NONE", float(latest["close"]), 0.0, reasons)
+            return Signal(symbol, "NONE", close, 0.0, reasons)
+
+        if close > channel_high and rsi_val >= 50:
+            return Signal(symbol, "LONG", close, 1.0, reasons)
+        if close < channel_low and rsi_val <= 50:
+            return Signal(symbol, "SHORT", close, 1.0, reasons)
+        return Signal(symbol, "NONE", close, 0.0, reasons)
+
+    def generate_series(
+        self, df: pd.DataFrame, settings: object, bundle: IndicatorBundle | None = None
+    ) -> pd.Series:
+        if bundle is None:
+            bundle = IndicatorBundle(df)
+        channel = donchian(df, period=settings.donchian_period)
+        close = df["close"]
+        rsi_val = bundle.rsi14
+        atr_series = bundle.atr14
+        expanding = atr_series.expanding()
+        atr_z = (atr_series - expanding.mean()) / expanding.std(ddof=0)
+        calm = ~(atr_z >= settings.atr_zscore_spike)
 
-        if latest["close"] > channel["high"].iloc[-1] and rsi_val >= 50:
-            return Signal(symbol, "LONG", float(latest["close"]), 1.0, reasons)
-        if latest["close"] < channel["low"].iloc[-1] and rsi_val <= 50:
-            return Signal(symbol, "SHORT", float(latest["close"]), 1.0, reasons)
-        return Signal(symbol, "NONE", float(latest["close"]), 0.0, reasons)
+        long = calm & (close > channel["high"]) & (rsi_val >= 50)
+        short = calm & (close < channel["low"]) & (rsi_val <= 50)
+        signals = np.select([long, short], ["LONG", "SHORT"], default="NONE")
+        return pd.Series(signals, index=df.index)
 
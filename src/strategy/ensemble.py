@@ -1,21 +1,35 @@
 """Confluence engine for multiple strategies."""
 from __future__ import annotations
 
+from collections import Counter
 from dataclasses import dataclass
+from operator import attrgetter
 from typing import Any, Iterable
 
+import numpy as np
 import pandas as pd
 
 from strategy.base import Signal, Strategy
+from strategy.indicators import IndicatorBundle
 
 
-@dataclass
+@dataclass(slots=True)
 class EnsembleDecision:
     signal: Signal
     votes: dict[str, str]
     reasons: dict[str, Any]
 
 
+# Per strategy: (only trades a RANGE regime, sits out while BTC is in SQUEEZE/CHOP).
+_STRATEGY_GATES = {
+    "trend_ema": (False, True),
+    "breakout_donchian": (False, True),
+    "mean_reversion_bb": (True, False),
+}
+_NO_GATES = (False, False)
+_BTC_BLOCKING_STATES = frozenset({"SQUEEZE", "CHOP"})
+
+
 def _filter_strategies(
     strategies: Iterable[Strategy],
     regime: str,
@@ -24,28 +38,109 @@ def _filter_strategies(
 ) -> list[Strategy]:
     if mqs < 50 or regime == "CHAOTIC":
         return []
+    not_range = regime != "RANGE"
+    btc_blocked = btc_state in _BTC_BLOCKING_STATES
     allowed = []
     for strat in strategies:
-        if strat.name == "mean_reversion_bb" and regime != "RANGE":
-            continue
-        if strat.name in {"trend_ema", "breakout_donchian"} and btc_state in {"SQUEEZE", "CHOP"}:
+        range_only, btc_sensitive = _STRATEGY_GATES.get(strat.name, _NO_GATES)
+        if (range_only and not_range) or (btc_sensitive and btc_blocked):
             continue
         allowed.append(strat)
     return allowed
 
 
+_STRATEGY_SETTINGS = {
+    "trend_ema": attrgetter("trend"),
+    "breakout_donchian": attrgetter("breakout"),
+    "mean_reversion_bb": attrgetter("mean_reversion"),
+}
+
+
 def _strategy_settings(settings: Any, name: str) -> Any:
     """Return the per-strategy settings block from either Settings or StrategySettings."""
     # Support both the top-level Settings (settings.strategy.*) and direct StrategySettings
     # to avoid attribute errors when callers pass the full Settings object.
     strategy_settings = getattr(settings, "strategy", settings)
-    if name == "trend_ema":
-        return strategy_settings.trend
-    if name == "breakout_donchian":
-        return strategy_settings.breakout
-    if name == "mean_reversion_bb":
-        return strategy_settings.mean_reversion
-    return strategy_settings
+    resolve = _STRATEGY_SETTINGS.get(name)
+    return strategy_settings if resolve is None else resolve(strategy_settings)
+
+
+def tally_votes(votes: dict[str, str], mqs: int, settings: Any) -> tuple[str, float]:
+    """Resolve per-strategy votes into a direction and confidence."""
+    counts = Counter(votes.values())
+    long_votes = counts["LONG"]
+    short_votes = counts["SHORT"]
+    total = len(votes)
+
+    required = 2 if total >= 3 else total
+    if 50 <= mqs < settings.market_quality.min_trade_score:
+        required = total
+
+    direction = "NONE"
+    if long_votes >= required and long_votes > short_votes:
+        direction = "LONG"
+    elif short_votes >= required and short_votes > long_votes:
+        direction = "SHORT"
+
+    confidence = max(long_votes, short_votes) / total if total else 0.0
+    return direction, confidence
+
+
+def precompute_strategy_signals(
+    df: pd.DataFrame,
+    strategies: Iterable[Strategy],
+    settings: Any,
+    bundle: IndicatorBundle | None = None,
+) -> dict[str, np.ndarray]:
+    """Evaluate every strategy over the full frame once, keyed by strategy name.
+
+    The strategies share one indicator bundle, so RSI and ATR are computed once.
+    """
+    if bundle is None:
+        bundle = IndicatorBundle(df)
+    return {
+        strat.name: strat.generate_series(
+            df, _strategy_settings(settings, strat.name), bundle
+        ).to_numpy()
+        for strat in strategies
+    }
+
+
+def ensemble_series(
+    signals: dict[str, np.ndarray],
+    strategies: Iterable[Strategy],
+    regimes: np.ndarray,
+    btc_states: np.ndarray,
+    mqs: np.ndarray,
+    settings: Any,
+) -> np.ndarray:
+    """Ensemble direction for every row, as ``ensemble`` would decide it row by row.
+
+    Mirrors ``_filter_strategies`` and ``tally_votes`` with boolean masks.
+    """
+    tradable = (mqs >= 50) & (regimes != "CHAOTIC")
+    btc_blocked = np.isin(btc_states, list(_BTC_BLOCKING_STATES))
+    long_votes = np.zeros(len(mqs), dtype=np.int64)
+    short_votes = np.zeros(len(mqs), dtype=np.int64)
+    total = np.zeros(len(mqs), dtype=np.int64)
+    for strat in strategies:
+        allowed = tradable
+        range_only, btc_sensitive = _STRATEGY_GATES.get(strat.name, _NO_GATES)
+        if range_only:
+            allowed = allowed & (regimes == "RANGE")
+        if btc_sensitive:
+            allowed = allowed & ~btc_blocked
+        votes = signals[strat.name]
+        long_votes += allowed & (votes == "LONG")
+        short_votes += allowed & (votes == "SHORT")
+        total += allowed
+
+    required = np.where(total >= 3, 2, total)
+    reduced = (mqs >= 50) & (mqs < settings.market_quality.min_trade_score)
+    required = np.where(reduced, total, required)
+    long = (long_votes >= required) & (long_votes > short_votes)
+    short = (short_votes >= required) & (short_votes > long_votes)
+    return np.select([long, short], ["LONG", "SHORT"], default="NONE")
 
 
 def ensemble(
@@ -56,7 +151,13 @@ def ensemble(
     btc_state: str,
     mqs: int,
     settings: Any,
+    bundle: IndicatorBundle | None = None,
 ) -> EnsembleDecision:
+    """Vote the allowed strategies on ``df``.
+
+    Strategies read their indicators from one shared ``bundle`` (built here when
+    not given), so RSI/ATR/closes are extracted once per frame, not per strategy.
+    """
     allowed = _filter_strategies(strategies, regime, btc_state, mqs)
     votes: dict[str, str] = {}
     reasons: dict[str, Any] = {
@@ -66,29 +167,17 @@ def ensemble(
     }
 
     if not allowed:
-        signal = Signal(symbol, "NONE", float(df["close"].iloc[-1]), 0.0, reasons)
+        signal = Signal(symbol, "NONE", float(df["close"].iat[-1]), 0.0, reasons)
         return EnsembleDecision(signal, votes, reasons)
 
+    if bundle is None:
+        bundle = IndicatorBundle(df)
     for strat in allowed:
         strat_settings = _strategy_settings(settings, strat.name)
-        result = strat.generate(symbol, df, strat_settings)
+        result = strat.generate_from_bundle(symbol, bundle, strat_settings)
         votes[strat.name] = result.direction
         reasons[strat.name] = result.reasons
 
-    long_votes = sum(1 for v in votes.values() if v == "LONG")
-    short_votes = sum(1 for v in votes.values() if v == "SHORT")
-    total = len(votes)
-
-    required = 2 if total >= 3 else total
-    if 50 <= mqs < settings.market_quality.min_trade_score:
-        required = total
-
-    direction = "NONE"
-    if long_votes >= required and long_votes > short_votes:
-        direction = "LONG"
-    elif short_votes >= required and short_votes > long_votes:
-        direction = "SHORT"
-
-    confidence = max(long_votes, short_votes) / total if total else 0.0
-    signal = Signal(symbol, direction, float(df["close"].iloc[-1]), confidence, reasons)
+    direction, confidence = tally_votes(votes, mqs, settings)
+    signal = Signal(symbol, direction, float(bundle.close[-1]), confidence, reasons)
     return EnsembleDecision(signal, votes, reasons)
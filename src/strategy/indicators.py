@@ -1,8 +1,12 @@
 """Indicator helpers."""
 from __future__ import annotations
 
+from collections import OrderedDict
+from functools import cached_property
+from typing import Hashable
+
+import numpy as np
 import pandas as pd
-import ta
 
 
 def ema(series: pd.Series, period: int) -> pd.Series:
@@ -10,26 +14,99 @@ def ema(series: pd.Series, period: int) -> pd.Series:
 
 
 def rsi(df: pd.DataFrame, period: int = 14) -> pd.Series:
-    return ta.momentum.rsi(df["close"], window=period)
+    """Wilder RSI; NaN until ``period`` changes are available, 100 when there are no losses."""
+    diff = df["close"].diff().to_numpy()
+    gains = pd.Series(np.where(diff > 0, diff, 0.0))
+    losses = pd.Series(np.where(diff < 0, -diff, 0.0))
+    avg_gain = gains.ewm(alpha=1 / period, min_periods=period, adjust=False).mean().to_numpy()
+    avg_loss = losses.ewm(alpha=1 / period, min_periods=period, adjust=False).mean().to_numpy()
+    with np.errstate(divide="ignore", invalid="ignore"):
+        values = np.where(avg_loss == 0, 100.0, 100 - 100 / (1 + avg_gain / avg_loss))
+    return pd.Series(values, index=df.index)
+
+
+def _seeded_ewm(seed: float, values: np.ndarray, period: int) -> np.ndarray:
+    """Run ``x[i] = x[i-1] * (1 - 1/period) + values[i-1] / period`` from ``x[0] = seed``.
+
+    The recursion goes through pandas' compiled ``ewm`` instead of a Python loop.
+    """
+    sequence = np.empty(len(values) + 1)
+    sequence[0] = seed
+    sequence[1:] = values
+    return pd.Series(sequence).ewm(alpha=1 / period, adjust=False).mean().to_numpy()
+
+
+def _wilder(values: np.ndarray, period: int) -> np.ndarray:
+    """Wilder smoothing seeded with the mean of the first ``period`` values.
+
+    Rows before the seed are 0.0, the usual convention for these indicators.
+    """
+    out = np.zeros(len(values))
+    if len(values) >= period:
+        out[period - 1 :] = _seeded_ewm(values[:period].mean(), values[period:], period)
+    return out
+
+
+def atr_array(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int = 14) -> np.ndarray:
+    """:func:`atr` on float64 arrays, for callers that never need a Series."""
+    prev_close = np.empty_like(close)
+    prev_close[:1] = np.nan
+    prev_close[1:] = close[:-1]
+    # fmax skips NaN like DataFrame.max, so the first row (no previous close) is high - low.
+    true_range = np.fmax.reduce([high - low, np.abs(high - prev_close), np.abs(low - prev_close)])
+    return _wilder(true_range, period)
 
 
 def atr(df: pd.DataFrame, period: int = 14) -> pd.Series:
-    return ta.volatility.average_true_range(df["high"], df["low"], df["close"], window=period)
+    values = atr_array(
+        df["high"].to_numpy(dtype=np.float64),
+        df["low"].to_numpy(dtype=np.float64),
+        df["close"].to_numpy(dtype=np.float64),
+        period,
+    )
+    return pd.Series(values, index=df.index)
 
 
 def adx(df: pd.DataFrame, period: int = 14) -> pd.Series:
-    return ta.trend.adx(df["high"], df["low"], df["close"], window=period)
+    """Wilder ADX; 0.0 until ``2 * period`` candles are available.
+
+    True range and directional movement are Wilder sums seeded with the first
+    ``period`` values, the ADX itself a Wilder average of the DX.
+    """
+    high = df["high"].to_numpy(dtype=np.float64)
+    low = df["low"].to_numpy(dtype=np.float64)
+    close = df["close"].to_numpy(dtype=np.float64)
+    out = np.zeros(len(close))
+    if len(close) < 2 * period:
+        return pd.Series(out, index=df.index)
+
+    prev_close = close[:-1]
+    true_range = np.maximum(high[1:], prev_close) - np.minimum(low[1:], prev_close)
+    up = np.diff(high)
+    down = -np.diff(low)
+    plus_dm = np.where((up > down) & (up > 0), up, 0.0)
+    minus_dm = np.where((down > up) & (down > 0), down, 0.0)
+
+    def wilder_sum(values: np.ndarray) -> np.ndarray:
+        # Sums ``s[i] = s[i-1] - s[i-1]/period + x`` are ``period`` times the average.
+        return period * _seeded_ewm(values[:period].sum() / period, values[period:], period)
+
+    tr_sum = wilder_sum(true_range)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        plus_di = np.where(tr_sum != 0, 100 * wilder_sum(plus_dm) / tr_sum, 0.0)
+        minus_di = np.where(tr_sum != 0, 100 * wilder_sum(minus_dm) / tr_sum, 0.0)
+        di_sum = plus_di + minus_di
+        dx = np.where(di_sum != 0, 100 * np.abs(plus_di - minus_di) / di_sum, 0.0)
+    out[2 * period - 1 :] = _seeded_ewm(dx[:period].mean(), dx[period:], period)
+    return pd.Series(out, index=df.index)
 
 
 def bbands(df: pd.DataFrame, period: int = 20, std: float = 2.0) -> pd.DataFrame:
-    indicator = ta.volatility.BollingerBands(df["close"], window=period, window_dev=std)
-    return pd.DataFrame(
-        {
-            "lower": indicator.bollinger_lband(),
-            "middle": indicator.bollinger_mavg(),
-            "upper": indicator.bollinger_hband(),
-        }
-    )
+    """Bollinger bands over a rolling mean and population standard deviation."""
+    window = df["close"].rolling(period)
+    middle = window.mean()
+    spread = std * window.std(ddof=0)
+    return pd.DataFrame({"lower": middle - spread, "middle": middle, "upper": middle + spread})
 
 
 def bb_width(df: pd.DataFrame, period: int = 20, std: float = 2.0) -> pd.Series:
@@ -42,3 +119,79 @@ def donchian(df: pd.DataFrame, period: int = 20) -> pd.DataFrame:
     low = df["low"].rolling(window=period).min()
     return pd.DataFrame({"high": high, "low": low})
 
+
+def donchian_last(df: pd.DataFrame, period: int = 20) -> tuple[float, float]:
+    """Latest ``(high, low)`` of :func:`donchian`, scanning only the last ``period`` candles."""
+    if len(df) < period:
+        return float("nan"), float("nan")
+    high = df["high"].to_numpy(dtype=np.float64)[-period:]
+    low = df["low"].to_numpy(dtype=np.float64)[-period:]
+    return float(high.max()), float(low.min())
+
+
+class IndicatorBundle:
+    """Indicators shared by the regime, market quality, BTC state and strategy checks.
+
+    Each one is computed on first access and then reused, so callers sharing a
+    bundle never evaluate the same indicator twice and never pay for ones they
+    do not read.
+    """
+
+    def __init__(self, df: pd.DataFrame) -> None:
+        self.df = df
+
+    @cached_property
+    def close(self) -> np.ndarray:
+        return self.df["close"].to_numpy(dtype=np.float64)
+
+    @cached_property
+    def atr14(self) -> pd.Series:
+        return atr(self.df, 14)
+
+    @cached_property
+    def rsi14(self) -> pd.Series:
+        return rsi(self.df, 14)
+
+    @cached_property
+    def ema9(self) -> pd.Series:
+        return ema(self.df["close"], 9)
+
+    @cached_property
+    def ema21(self) -> pd.Series:
+        return ema(self.df["close"], 21)
+
+    @cached_property
+    def adx14(self) -> pd.Series:
+        return adx(self.df, 14)
+
+    @cached_property
+    def ema50(self) -> pd.Series:
+        return ema(self.df["close"], 50)
+
+    @cached_property
+    def bb_width20(self) -> pd.Series:
+        return bb_width(self.df, period=20, std=2.0)
+
+    @cached_property
+    def atr_pct(self) -> pd.Series:
+        return self.atr14 / self.df["close"]
+
+
+_BUNDLE_CACHE: OrderedDict[Hashable, IndicatorBundle] = OrderedDict()
+_BUNDLE_CACHE_SIZE = 512
+
+
+def cached_bundle(key: Hashable, df: pd.DataFrame) -> IndicatorBundle:
+    """Return the bundle for ``df``, reusing it while ``key`` is unchanged.
+
+    ``key`` must identify the frame's contents, e.g. symbol plus last candle.
+    """
+    bundle = _BUNDLE_CACHE.get(key)
+    if bundle is not None:
+        _BUNDLE_CACHE.move_to_end(key)
+        return bundle
+    bundle = _BUNDLE_CACHE[key] = IndicatorBundle(df)
+    if len(_BUNDLE_CACHE) > _BUNDLE_CACHE_SIZE:
+        _BUNDLE_CACHE.popitem(last=False)
+    return bundle
+
@@ -1,32 +1,54 @@
 """Mean reversion Bollinger strategy."""
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 
 from strategy.base import Signal, Strategy
-from strategy.indicators import bbands
+from strategy.indicators import IndicatorBundle, bbands
 
 
 class MeanReversionBBStrategy(Strategy):
     name = "mean_reversion_bb"
 
     def generate(self, symbol: str, df: pd.DataFrame, settings: object) -> Signal:
-        bands = bbands(df, period=settings.bb_period, std=settings.bb_std)
-        latest = df.iloc[-1]
-        prev = df.iloc[-2]
-        lower = bands["lower"].iloc[-1]
-        upper = bands["upper"].iloc[-1]
+        return self.generate_from_bundle(symbol, IndicatorBundle(df), settings)
+
+    def generate_from_bundle(
+        self, symbol: str, bundle: IndicatorBundle, settings: object
+    ) -> Signal:
+        # The last band value only depends on the last ``bb_period`` closes.
+        period = settings.bb_period
+        bands = bbands(bundle.df.iloc[-period:], period=period, std=settings.bb_std)
+        closes = bundle.close
+        close, prev_close = float(closes[-1]), float(closes[-2])
+        lower = bands["lower"].to_numpy()[-1]
+        upper = bands["upper"].to_numpy()[-1]
 
         reasons = {
             "lower": float(lower),
             "upper": float(upper),
-            "prev_close": float(prev["close"]),
-            "close": float(latest["close"]),
+            "prev_close": prev_close,
+            "close": close,
         }
 
-        if prev["close"] < lower and latest["close"] > lower:
-            return Signal(symbol, "LONG", float(latest["close"]), 1.0, reasons)
-        if prev["close"] > upper and latest["close"] < upper:
-            return Signal(symbol, "SHORT", float(latest["close"]), 1.0, reasons)
-        return Signal(symbol, "NONE", float(latest["close"]), 0.0, reasons)
+        if prev_close < lower and close > lower:
+            return Signal(symbol, "LONG", close, 1.0, reasons)
+        if prev_close > upper and close < upper:
+            return Signal(symbol, "SHORT", close, 1.0, reasons)
+        return Signal(symbol, "NONE", close, 0.0, reasons)
+
+    def generate_series(
+        self, df: pd.DataFrame, settings: object, bundle: IndicatorBundle | None = None
+    ) -> pd.Series:
+        bands = bbands(df, period=settings.bb_period, std=settings.bb_std)
+        close = df["close"]
+        prev_close = close.shift(1)
+        lower = bands["lower"]
+        upper = bands["upper"]
+
+        long = (prev_close < lower) & (close > lower)
+        short = (prev_close > upper) & (close < upper)
+        signals = np.select([long, short], ["LONG", "SHORT"], default="NONE")
+        return pd.Series(signals, index=df.index)
 
@@ -2,26 +2,26 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import Sequence
 
 import numpy as np
 
 
-@dataclass
+@dataclass(slots=True)
 class StrategyPerformance:
     expectancy: float
     winrate: float
     max_drawdown: float
 
 
-def compute_performance(pnls: list[float]) -> StrategyPerformance:
-    if not pnls:
+def compute_performance(pnls: Sequence[float] | np.ndarray) -> StrategyPerformance:
+    arr = np.asarray(pnls, dtype=np.float64)
+    if arr.size == 0:
         return StrategyPerformance(0.0, 0.0, 0.0)
-    wins = len([p for p in pnls if p > 0])
-    winrate = wins / len(pnls)
-    expectancy = float(np.mean(pnls))
-    cumulative = np.cumsum(pnls)
-    peak = np.maximum.accumulate(cumulative)
-    dd = float(np.min(cumulative - peak)) if len(cumulative) else 0.0
+    winrate = int(np.count_nonzero(arr > 0)) / arr.size
+    expectancy = float(arr.mean())
+    cumulative = np.cumsum(arr)
+    dd = float((cumulative - np.maximum.accumulate(cumulative)).min())
     return StrategyPerformance(expectancy, winrate, dd)
 
 
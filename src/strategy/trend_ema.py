@@ -1,46 +1,69 @@
 """Trend-following EMA strategy."""
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 
 from strategy.base import Signal, Strategy
-from strategy.indicators import atr, ema, rsi
+from strategy.indicators import IndicatorBundle
 
 
 class TrendEmaStrategy(Strategy):
     name = "trend_ema"
 
     def generate(self, symbol: str, df: pd.DataFrame, settings: object) -> Signal:
-        ema9 = ema(df["close"], 9)
-        ema21 = ema(df["close"], 21)
-        rsi_val = rsi(df, 14)
-        atr_val = atr(df, 14)
-        latest = df.iloc[-1]
-        prev = df.iloc[-2]
-        atr_pct = atr_val.iloc[-1] / latest["close"]
+        return self.generate_from_bundle(symbol, IndicatorBundle(df), settings)
+
+    def generate_from_bundle(
+        self, symbol: str, bundle: IndicatorBundle, settings: object
+    ) -> Signal:
+        ema9 = bundle.ema9.to_numpy()[-1]
+        ema21 = bundle.ema21.to_numpy()[-1]
+        rsi_val = bundle.rsi14.to_numpy()[-1]
+        atr_val = bundle.atr14.to_numpy()[-1]
+        closes = bundle.close
+        close, prev_close = float(closes[-1]), closes[-2]
+        atr_pct = atr_val / close
 
         reasons = {
-            "ema9": float(ema9.iloc[-1]),
-            "ema21": float(ema21.iloc[-1]),
-            "rsi": float(rsi_val.iloc[-1]),
+            "ema9": float(ema9),
+            "ema21": float(ema21),
+            "rsi": float(rsi_val),
             "atr_pct": float(atr_pct),
         }
 
         if (
-            ema9.iloc[-1] > ema21.iloc[-1]
-            and rsi_val.iloc[-1] >= 52
-            and latest["close"] > prev["close"]
-            and latest["close"] > ema9.iloc[-1]
+            ema9 > ema21
+            and rsi_val >= 52
+            and close > prev_close
+            and close > ema9
             and atr_pct >= settings.min_atr_pct
         ):
-            return Signal(symbol, "LONG", float(latest["close"]), 1.0, reasons)
+            return Signal(symbol, "LONG", close, 1.0, reasons)
         if (
-            ema9.iloc[-1] < ema21.iloc[-1]
-            and rsi_val.iloc[-1] <= 48
-            and latest["close"] < prev["close"]
-            and latest["close"] < ema9.iloc[-1]
+            ema9 < ema21
+            and rsi_val <= 48
+            and close < prev_close
+            and close < ema9
             and atr_pct >= settings.min_atr_pct
         ):
-            return Signal(symbol, "SHORT", float(latest["close"]), 1.0, reasons)
-        return Signal(symbol, "NONE", float(latest["close"]), 0.0, reasons)
+            return Signal(symbol, "SHORT", close, 1.0, reasons)
+        return Signal(symbol, "NONE", close, 0.0, reasons)
+
+    def generate_series(
+        self, df: pd.DataFrame, settings: object, bundle: IndicatorBundle | None = None
+    ) -> pd.Series:
+        if bundle is None:
+            bundle = IndicatorBundle(df)
+        close = df["close"]
+        ema9 = bundle.ema9
+        ema21 = bundle.ema21
+        rsi_val = bundle.rsi14
+        prev_close = close.shift(1)
+        volatile = bundle.atr14 / close >= settings.min_atr_pct
+
+        long = (ema9 > ema21) & (rsi_val >= 52) & (close > prev_close) & (close > ema9) & volatile
+        short = (ema9 < ema21) & (rsi_val <= 48) & (close < prev_close) & (close < ema9) & volatile
+        signals = np.select([long, short], ["LONG", "SHORT"], default="NONE")
+        return pd.Series(signals, index=df.index)
 
@@ -0,0 +1,23 @@
+import threading
+
+from exchange.binance_futures import BinanceFuturesClient
+
+
+def test_retry_after_reads_the_failing_threads_headers():
+    client = BinanceFuturesClient()
+    main_client = client.client
+    main_client.last_response_headers = {"Retry-After": "7"}
+    seen = {}
+
+    def worker():
+        # Another thread's 429 must not leak into this thread's retry delay.
+        assert client.client is not main_client
+        client.client.last_response_headers = {"Retry-After": "2"}
+        seen["worker"] = client.guard.retry_after(Exception())
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    thread.join()
+    assert seen["worker"] == 2.0
+    assert client.guard.retry_after(Exception()) == 7.0
+    assert client.client is main_client
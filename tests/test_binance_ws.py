@@ -0,0 +1,58 @@
+import asyncio
+
+from exchange.binance_ws import KlineFeed
+
+
+def _candle(open_time: int, close: float) -> list[float]:
+    return [open_time, close, close + 1, close - 1, close, 10.0]
+
+
+def test_record_detects_close_and_drain_orders_candles():
+    feed = KlineFeed()
+    feed._record({"BTC/USDT": {"15m": [_candle(2_000, 101.0)]}}, "15m")
+    # Updates to the forming candle neither close it nor add a row.
+    feed._record({"BTC/USDT": {"15m": [_candle(2_000, 102.0)]}}, "15m")
+    assert not feed.wait_for_close(0)
+    # An older candle arriving late is kept but does not signal a close.
+    feed._record({"BTC/USDT": {"15m": [_candle(1_000, 100.0)]}}, "15m")
+    assert not feed.wait_for_close(0)
+    feed._record({"BTC/USDT": {"15m": [_candle(3_000, 103.0)]}}, "15m")
+    assert feed.wait_for_close(0)
+    # Other timeframes are ignored.
+    feed._record({"ETH/USDT": {"1h": [_candle(3_000, 10.0)]}}, "15m")
+
+    drained = feed.drain()
+    assert list(drained) == ["BTC/USDT"]
+    assert [row[0] for row in drained["BTC/USDT"]] == [1_000, 2_000, 3_000]
+    assert drained["BTC/USDT"][1][4] == 102.0
+    assert feed.drain() == {}
+    assert not feed.wait_for_close(0)
+
+
+def test_subscribe_is_a_no_op_for_the_same_set_and_reports_gaps(monkeypatch):
+    watched = []
+
+    async def fake_watch(self, symbols, timeframe):
+        watched.append(symbols)
+        try:
+            await asyncio.sleep(3600)
+        except asyncio.CancelledError:
+            self._gap.set()
+            raise
+
+    monkeypatch.setattr(KlineFeed, "_watch", fake_watch)
+    feed = KlineFeed()
+    try:
+        assert feed.subscribe(["ETH/USDT", "BTC/USDT"], "15m")
+        assert not feed.subscribe(["BTC/USDT", "ETH/USDT", "BTC/USDT"], "15m")
+        assert feed.subscribe(["BTC/USDT"], "15m")
+        assert feed.subscribe(["BTC/USDT"], "1h")
+        # A resubscription starts clean; an error on the live stream is reported once.
+        assert not feed.take_gap()
+        feed._gap.set()
+        assert feed.take_gap()
+        assert not feed.take_gap()
+    finally:
+        feed.close()
+    assert feed.symbols == () and feed.timeframe is None
+    assert len(watched) == 3
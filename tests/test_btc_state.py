@@ -0,0 +1,34 @@
+import numpy as np
+import pandas as pd
+
+from data.btc_state import btc_state_series, detect_btc_state
+
+
+def _btc_df() -> pd.DataFrame:
+    prices = np.concatenate(
+        [np.full(60, 100.0), np.linspace(100, 130, 60), np.linspace(130, 100, 60)]
+    )
+    spread = np.concatenate([np.full(60, 0.001), np.full(120, 0.004)])
+    return pd.DataFrame(
+        {
+            "open": prices,
+            "high": prices * (1 + spread),
+            "low": prices * (1 - spread),
+            "close": prices,
+        }
+    )
+
+
+def test_btc_state_series_matches_expanding_windows():
+    df = _btc_df()
+
+    class Settings:
+        squeeze_bb_width = 0.04
+        squeeze_atr_pct = 0.003
+        expanding_atr_pct = 0.006
+        trend_slope = 0.0005
+
+    states = btc_state_series(df, Settings())
+    assert {"SQUEEZE", "EXPANDING_UP", "EXPANDING_DOWN"} <= set(states)
+    for idx in range(20, len(df)):
+        assert states.iloc[idx] == detect_btc_state(df.iloc[: idx + 1], Settings()).state
@@ -1,7 +1,10 @@
+import itertools
+
+import numpy as np
 import pandas as pd
 
 from strategy.base import Signal, Strategy
-from strategy.ensemble import ensemble
+from strategy.ensemble import ensemble, ensemble_series
 
 
 class DummyStrategy(Strategy):
@@ -49,3 +52,37 @@ def test_ensemble_voting():
     ]
     decision = ensemble("BTC/USDT", df, strategies, "TREND_CLEAN", "EXPANDING_UP", 80, Settings())
     assert decision.signal.direction == "LONG"
+
+
+def test_ensemble_series_matches_row_by_row_ensemble():
+    df = pd.DataFrame({"open": [1.0], "high": [1.1], "low": [0.9], "close": [1.0]})
+
+    class Settings:
+        class MarketQuality:
+            min_trade_score = 70
+
+        market_quality = MarketQuality()
+        trend = breakout = mean_reversion = object()
+
+    names = ["trend_ema", "breakout_donchian", "mean_reversion_bb"]
+    rows = list(
+        itertools.product(
+            itertools.product(["LONG", "SHORT", "NONE"], repeat=3),
+            ["TREND_CLEAN", "RANGE", "CHAOTIC"],
+            ["EXPANDING_UP", "SQUEEZE", "CHOP"],
+            [40, 60, 80],
+        )
+    )
+    signals = {name: np.array([row[0][i] for row in rows]) for i, name in enumerate(names)}
+    result = ensemble_series(
+        signals,
+        [DummyStrategy(name, "NONE") for name in names],
+        np.array([row[1] for row in rows], dtype=object),
+        np.array([row[2] for row in rows], dtype=object),
+        np.array([row[3] for row in rows]),
+        Settings(),
+    )
+    for direction, (votes, regime, btc_state, mqs) in zip(result, rows):
+        strategies = [DummyStrategy(name, vote) for name, vote in zip(names, votes)]
+        expected = ensemble("BTC/USDT", df, strategies, regime, btc_state, mqs, Settings())
+        assert direction == expected.signal.direction
@@ -0,0 +1,23 @@
+from exchange.cache import TTLCache, ttl_cached
+
+
+def test_ttl_cached_reuses_result_and_warms_from_disk(tmp_path):
+    cache = TTLCache(tmp_path)
+    calls = []
+
+    @ttl_cached(ttl=60, key="markets", cache=cache)
+    def fetch():
+        calls.append(1)
+        return [{"symbol": "BTC/USDT"}]
+
+    assert fetch() == fetch() == [{"symbol": "BTC/USDT"}]
+    assert len(calls) == 1
+    assert (tmp_path / "markets.json").exists()
+
+    assert TTLCache(tmp_path).get("markets") == [{"symbol": "BTC/USDT"}]
+
+
+def test_expired_entries_are_ignored(tmp_path):
+    cache = TTLCache(tmp_path)
+    cache.set("tickers", {"BTC/USDT": {}}, ttl=-1)
+    assert cache.get("tickers") is None
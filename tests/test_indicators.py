@@ -1,6 +1,6 @@
 import pandas as pd
 
-from strategy.indicators import adx, atr, bbands, donchian, ema, rsi
+from strategy.indicators import adx, atr, bbands, donchian, donchian_last, ema, rsi
 
 
 def _sample_df() -> pd.DataFrame:
@@ -23,3 +23,21 @@ def test_indicators_basic():
     assert bands["upper"].iloc[-1] > bands["lower"].iloc[-1]
     channel = donchian(df, 20)
     assert channel["high"].iloc[-1] >= df["high"].iloc[-1]
+    assert donchian_last(df, 20) == (channel["high"].iloc[-1], channel["low"].iloc[-1])
+
+
+def test_atr_matches_wilder_recursion():
+    df = _sample_df()
+    df["high"] = df["high"] + [0.05 * (i % 3) for i in range(60)]
+    prev_close = df["close"].shift(1)
+    true_range = pd.concat(
+        [df["high"] - df["low"], (df["high"] - prev_close).abs(), (df["low"] - prev_close).abs()],
+        axis=1,
+    ).max(axis=1)
+    expected = [0.0] * 13 + [true_range.iloc[:14].mean()]
+    for value in true_range.iloc[14:]:
+        expected.append((expected[-1] * 13 + value) / 14)
+
+    result = atr(df, 14)
+    assert all(abs(a - b) < 1e-12 for a, b in zip(result, expected))
+    assert atr(df.iloc[:5], 14).eq(0.0).all()
@@ -1,4 +1,6 @@
-from execution.paper import simulate_trade
+import numpy as np
+
+from execution.paper import simulate_trade, simulate_trades
 
 
 def test_paper_execution_worst_case():
@@ -27,3 +29,26 @@ def test_paper_execution_take():
         worst_case_same_candle=True,
     )
     assert result.status == "TAKE"
+
+
+def test_simulate_trades_matches_scalar():
+    cases = [
+        ("LONG", 100, 95, 105, 106, 94),
+        ("LONG", 100, 95, 105, 106, 96),
+        ("LONG", 100, 95, 105, 101, 94),
+        ("LONG", 100, 95, 105, 101, 99),
+        ("SHORT", 100, 105, 95, 106, 94),
+        ("SHORT", 100, 105, 95, 103, 94),
+        ("SHORT", 100, 105, 95, 106, 97),
+    ]
+    columns = [np.array(column) for column in zip(*cases)]
+    for worst_case in (True, False):
+        statuses, exit_prices, pnls = simulate_trades(*columns, worst_case_same_candle=worst_case)
+        for i, case in enumerate(cases):
+            expected = simulate_trade(*case, fee_rate=0.0004, worst_case_same_candle=worst_case)
+            assert statuses[i] == expected.status
+            if expected.exit_price is None:
+                assert np.isnan(exit_prices[i]) and np.isnan(pnls[i])
+            else:
+                assert exit_prices[i] == expected.exit_price
+                assert pnls[i] == expected.pnl_pct
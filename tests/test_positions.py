@@ -0,0 +1,36 @@
+from execution.positions import OpenPositions
+
+
+def test_open_positions_add_close_and_grow():
+    positions = OpenPositions.from_rows(
+        [
+            {
+                "id": 1,
+                "symbol": "BTC/USDT",
+                "direction": "LONG",
+                "entry_price": 100,
+                "stop_price": 95,
+                "take_price": 110,
+            },
+            {
+                "id": 2,
+                "symbol": "ETH/USDT",
+                "direction": "SHORT",
+                "entry_price": 10,
+                "stop_price": 11,
+                "take_price": 9,
+            },
+        ]
+    )
+    for trade_id in range(3, 12):
+        positions.add(trade_id, "BTC/USDT", "SHORT", 100.0, 105.0, 90.0)
+
+    btc_rows = positions.rows("BTC/USDT")
+    assert len(positions) == 11
+    assert positions.direction(int(btc_rows[0])) == "LONG"
+    assert positions.ids[btc_rows].tolist() == [1, *range(3, 12)]
+
+    positions.close("ETH/USDT", int(positions.rows("ETH/USDT")[0]))
+    assert "ETH/USDT" not in positions
+    assert list(positions) == ["BTC/USDT"]
+    assert len(positions) == 10
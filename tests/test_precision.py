@@ -0,0 +1,38 @@
+import numpy as np
+
+from exchange.precision import SymbolPrecision, normalize_array, normalize_price, normalize_qty
+
+
+def test_normalize_floors_to_exact_ticks():
+    precision = SymbolPrecision(tick_size=0.01, step_size=0.001, min_qty=0.001, min_notional=5)
+    assert precision.tick_scale == 100
+    assert normalize_price(1.15, precision) == 1.15
+    assert normalize_price(101.239, precision) == 101.23
+    assert normalize_qty(0.0299, precision) == 0.029
+
+
+def test_normalize_falls_back_for_non_reciprocal_steps():
+    precision = SymbolPrecision(tick_size=0.5, step_size=10, min_qty=10, min_notional=5)
+    assert precision.step_scale == 0
+    assert normalize_price(101.7, precision) == 101.5
+    assert normalize_qty(127, precision) == 120
+
+
+def test_normalize_array_matches_scalar():
+    prices = np.array([1.15, 101.239, 0.12345, 27123.456])
+    scales = np.array([100, 100, 10_000, 10])
+    expected = [
+        normalize_price(price, SymbolPrecision(1 / scale, 1, 0, 0))
+        for price, scale in zip(prices, scales)
+    ]
+    assert normalize_array(prices, scales).tolist() == expected
+
+
+def test_normalize_floors_large_values_within_a_tick():
+    precision = SymbolPrecision(tick_size=0.01, step_size=0.001, min_qty=0.001, min_notional=5)
+    assert normalize_price(99999.99999999, precision) == 99999.99
+    # Past 1e9 ticks a relative tolerance would cover a whole tick and round up.
+    assert normalize_qty(1_234_567.9999, precision) == 1_234_567.999
+    values = np.array([99999.99999999, 1_234_567.9999, 1.15])
+    scales = np.array([100, 1000, 100])
+    assert normalize_array(values, scales).tolist() == [99999.99, 1_234_567.999, 1.15]
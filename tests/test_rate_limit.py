@@ -0,0 +1,59 @@
+from exchange import rate_limit
+from exchange.rate_limit import RateLimitGuard, TokenBucket
+
+
+class Throttled(Exception):
+    pass
+
+
+def test_guard_honours_retry_after_and_slows_bucket(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(rate_limit.time, "sleep", sleeps.append)
+    bucket = TokenBucket(rate=10.0)
+    guard = RateLimitGuard(
+        bucket=bucket,
+        throttle_errors=(Throttled,),
+        retry_after=lambda _exc: 3.0,
+    )
+    calls = []
+
+    def flaky():
+        calls.append(1)
+        if len(calls) == 1:
+            raise Throttled("429")
+        return "ok"
+
+    assert guard.run(flaky) == "ok"
+    assert sleeps == [3.0]
+    assert bucket.rate == 10.0 * bucket.decrease + bucket.increase
+
+
+def test_get_shared_returns_one_guard_per_key():
+    first = RateLimitGuard.get_shared("test-key", max_retries=2)
+    assert RateLimitGuard.get_shared("test-key") is first
+    assert first.max_retries == 2
+    assert RateLimitGuard.get_shared("other-key") is not first
+
+
+def test_guard_persists_ip_ban_across_restarts(monkeypatch, tmp_path):
+    monkeypatch.setattr(rate_limit.time, "sleep", lambda _seconds: None)
+    path = tmp_path / "rate_limit.json"
+    guard = RateLimitGuard(
+        max_retries=1,
+        throttle_errors=(Throttled,),
+        retry_after=lambda _exc: 120.0,
+        state_path=path,
+    )
+
+    def banned():
+        raise Throttled("418")
+
+    try:
+        guard.run(banned)
+    except Throttled:
+        pass
+
+    restarted = RateLimitGuard(state_path=path)
+    assert restarted.breaker.failures == 1
+    assert not restarted.breaker.can_execute()
+    assert restarted.bucket.rate == guard.bucket.rate
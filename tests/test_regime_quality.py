@@ -1,8 +1,8 @@
 import numpy as np
 import pandas as pd
 
-from market.quality import market_quality_score
-from market.regime import detect_regime
+from market.quality import market_quality_score, market_quality_series
+from market.regime import detect_regime, regime_series
 
 
 def _trend_df() -> pd.DataFrame:
@@ -47,3 +47,22 @@ def test_regime_and_quality_scores():
 
     quality = market_quality_score(trend_df, spread=0.001, liquidity=2e7, settings=Settings())
     assert 0 <= quality.score <= 100
+
+
+def test_series_match_expanding_windows():
+    df = pd.concat([_trend_df(), _range_df()], ignore_index=True)
+
+    class Settings:
+        spread_penalty = 20
+        atr_low_penalty = 15
+        adx_low_penalty = 10
+        wick_penalty = 10
+        liquidity_bonus = 15
+        direction_bonus = 10
+
+    regimes = regime_series(df)
+    scores = market_quality_series(df, 0.001, 2e7, Settings())
+    for idx in range(60, len(df), 7):
+        window = df.iloc[: idx + 1]
+        assert regimes.iloc[idx] == detect_regime(window).regime
+        assert scores.iloc[idx] == market_quality_score(window, 0.001, 2e7, Settings()).score
@@ -0,0 +1,27 @@
+import pytest
+
+from storage.repo import SQLiteRepository
+
+
+def _btc_state_count(repo: SQLiteRepository) -> int:
+    return repo._conn.execute("SELECT COUNT(*) FROM btc_state").fetchone()[0]
+
+
+def test_transaction_commits_once_and_rolls_back_nested_writes(tmp_path):
+    repo = SQLiteRepository(str(tmp_path / "tob.sqlite"))
+
+    with pytest.raises(ValueError):
+        with repo.transaction():
+            repo.store_btc_state(1, "CHOP", {})
+            with repo.transaction():
+                repo.store_btc_state(2, "CHOP", {})
+            raise ValueError
+    assert _btc_state_count(repo) == 0
+    assert not repo._conn.in_transaction
+
+    with repo.transaction():
+        repo.store_btc_state(3, "SQUEEZE", {})
+        assert repo._conn.in_transaction
+    repo.store_btc_state(4, "SQUEEZE", {})
+    assert _btc_state_count(repo) == 2
+    assert not repo._conn.in_transaction
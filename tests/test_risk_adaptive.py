@@ -1,4 +1,7 @@
+import numpy as np
+
 from risk.adaptive import AdaptiveState, adjust_risk, update_streak
+from risk.sizing import position_size, position_size_arrays
 
 
 def test_adaptive_risk_reduction():
@@ -13,3 +16,11 @@ def test_adaptive_risk_reduction():
     defensive = adjust_risk(base_risk, state)
     assert defensive < reduced
     assert state.defensive_mode is True
+
+
+def test_position_size_arrays_matches_scalar():
+    entries = np.array([100.0, 50.0, 20.0])
+    stops = np.array([95.0, 50.0, 21.0])
+    qty = position_size_arrays(1000.0, 0.01, entries, stops)
+    expected = [position_size(1000.0, 0.01, e, s).qty for e, s in zip(entries, stops)]
+    assert qty.tolist() == expected
@@ -4,9 +4,9 @@ import sqlite3
 import time
 from typing import Any, Iterable
 
-from config.settings import Settings
+from config.settings import LiveSettings, Settings
 from exchange.base import ExchangeClient
-from runner import run_live
+from runner import _sync_cycle_candles, run_live
 
 
 class MockExchange(ExchangeClient):
@@ -109,3 +109,74 @@ def test_run_live_never_executes_real_trades(tmp_path: Any) -> None:
     )
 
     assert exchange.create_order_called is False
+
+
+class FakeCollector:
+    def __init__(self) -> None:
+        self.batches: list[list[str]] = []
+        self.stored: list[tuple[str, int]] = []
+
+    def sync_candles_batch(
+        self, symbols: list[str], timeframe: str, limit: int = 300
+    ) -> dict[str, int]:
+        self.batches.append(list(symbols))
+        return dict.fromkeys(symbols, 1)
+
+    def store_candles(self, symbol: str, timeframe: str, raw: list[list[float]]) -> int:
+        self.stored.append((symbol, len(raw)))
+        return len(raw)
+
+
+class FakeFeed:
+    def __init__(self) -> None:
+        self.symbols: tuple[str, ...] = ()
+        self.gap = False
+        self.pending: dict[str, list[list[float]]] = {}
+
+    def subscribe(self, symbols: Iterable[str], timeframe: str) -> bool:
+        wanted = tuple(sorted(set(symbols)))
+        changed = wanted != self.symbols
+        self.symbols = wanted
+        return changed
+
+    def take_gap(self) -> bool:
+        gap, self.gap = self.gap, False
+        return gap
+
+    def drain(self) -> dict[str, list[list[float]]]:
+        pending, self.pending = self.pending, {}
+        return pending
+
+
+def test_sync_cycle_candles_backfills_new_subscriptions_and_gaps() -> None:
+    collector = FakeCollector()
+    feed = FakeFeed()
+    backfilled: set[str] = set()
+
+    def sync(symbols: list[str]) -> dict[str, int]:
+        return _sync_cycle_candles(collector, feed, symbols, "15m", 50, backfilled)
+
+    assert sync(["BTC/USDT", "ETH/USDT"]) == {"BTC/USDT": 1, "ETH/USDT": 1}
+    # Same universe: only the streamed candles are stored, symbols outside it are dropped.
+    feed.pending = {"BTC/USDT": [[0.0] * 6, [1.0] * 6], "SOL/USDT": [[0.0] * 6]}
+    assert sync(["BTC/USDT", "ETH/USDT"]) == {"BTC/USDT": 2, "ETH/USDT": 0}
+    assert collector.batches == [["BTC/USDT", "ETH/USDT"]]
+    # ETH leaves and comes back: both changes resubscribe, so it is backfilled again.
+    sync(["BTC/USDT"])
+    sync(["BTC/USDT", "ETH/USDT"])
+    assert collector.batches[-1] == ["BTC/USDT", "ETH/USDT"]
+    # A stream error may have dropped candles for every symbol.
+    feed.gap = True
+    sync(["BTC/USDT", "ETH/USDT"])
+    assert collector.batches[-1] == ["BTC/USDT", "ETH/USDT"]
+    assert len(collector.batches) == 4
+    # Without a feed every symbol is polled.
+    assert _sync_cycle_candles(collector, None, ["BTC/USDT"], "15m", 50, set()) == {"BTC/USDT": 1}
+
+
+def test_live_settings_use_websocket(tmp_path: Any) -> None:
+    assert LiveSettings().use_websocket is False
+    assert Settings.load().live.use_websocket is False
+    config = tmp_path / "config.yaml"
+    config.write_text("live:\n  use_websocket: true\n")
+    assert Settings.load(config).live.use_websocket is True
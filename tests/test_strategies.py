@@ -67,3 +67,29 @@ def test_mean_reversion_signal():
     strat = MeanReversionBBStrategy()
     signal = strat.generate("BTC/USDT", df, Settings())
     assert signal.direction in {"LONG", "NONE"}
+
+
+def test_generate_series_matches_expanding_windows():
+    rng = np.random.default_rng(7)
+    prices = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, 150)))
+    df = pd.DataFrame(
+        {
+            "open": np.concatenate([[prices[0]], prices[:-1]]),
+            "high": prices * 1.006,
+            "low": prices * 0.994,
+            "close": prices,
+        }
+    )
+
+    class Settings:
+        min_atr_pct = 0.0001
+        donchian_period = 20
+        atr_zscore_spike = 2.5
+        bb_period = 20
+        bb_std = 2.0
+
+    for strat in (TrendEmaStrategy(), BreakoutDonchianStrategy(), MeanReversionBBStrategy()):
+        directions = strat.generate_series(df, Settings())
+        for idx in range(30, len(df)):
+            signal = strat.generate("BTC/USDT", df.iloc[: idx + 1], Settings())
+            assert directions.iloc[idx] == signal.direction
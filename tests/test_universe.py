@@ -1,70 +1,150 @@
+from types import MappingProxyType
+from typing import NamedTuple
+
 import numpy as np
 import pandas as pd
+import pytest
+
+from data.universe import (
+    UniverseBuilder,
+    _btc_stats,
+    _compute_betas_corrs_batch,
+    compute_beta,
+    compute_beta_corr,
+    compute_corr,
+)
 
-from data.universe import UniverseBuilder, compute_beta, compute_corr
+# Shared read-only results, so the dummy allocates nothing per call.
+_EMPTY_LIST: tuple = ()
+_EMPTY_DICT = MappingProxyType({})
 
 
 class DummyExchange:
+    __slots__ = ()
+
     def fetch_markets(self):
-        return []
+        return _EMPTY_LIST
 
     def fetch_tickers(self):
-        return {}
+        return _EMPTY_DICT
 
     def fetch_ohlcv(self, *args, **kwargs):
-        return []
+        return _EMPTY_LIST
 
     def create_order(self, *args, **kwargs):
-        return {}
+        return _EMPTY_DICT
 
     def set_leverage(self, *args, **kwargs):
         return None
 
 
 def _df_from_returns(returns: np.ndarray) -> pd.DataFrame:
-    prices = 100 * np.exp(np.cumsum(returns))
+    # One (n, 4) block filled in place; the frame wraps it without copying.
+    candles = np.empty((len(returns), 4))
+    prices = candles[:, 0]
+    np.cumsum(returns, out=prices)
+    np.exp(prices, out=prices)
+    prices *= 100
+    np.multiply(prices, 1.01, out=candles[:, 1])
+    np.multiply(prices, 0.99, out=candles[:, 2])
+    candles[:, 3] = prices
     return pd.DataFrame(
-        {
-            "open": prices,
-            "high": prices * 1.01,
-            "low": prices * 0.99,
-            "close": prices,
-        }
+        candles, columns=["open", "high", "low", "close"], dtype=np.float64, copy=False
+    )
+
+
+class Weights(NamedTuple):
+    volume: float
+    atr_pct: float
+    beta: float
+
+
+class Settings(NamedTuple):
+    volume_percentile: float
+    min_atr_pct: float
+    min_beta_btc: float
+    min_corr_btc: float
+    max_symbols: int
+    weights: Weights
+    manual_override: tuple[str, ...]
+
+
+class Market(NamedTuple):
+    btc_returns: np.ndarray
+    alt_returns: np.ndarray
+    btc_df: pd.DataFrame
+    alt_df: pd.DataFrame
+
+
+# Several lengths expose per-N overhead in the scalar and batched beta/correlation paths.
+@pytest.fixture(scope="module", params=[300, 3_000, 30_000])
+def market(request: pytest.FixtureRequest) -> Market:
+    n = request.param
+    rng = np.random.default_rng(42)
+    btc_returns = rng.standard_normal(n)
+    btc_returns *= 0.01
+    alt_returns = rng.standard_normal(n)
+    alt_returns *= 0.002
+    alt_returns += 1.5 * btc_returns
+    return Market(
+        btc_returns, alt_returns, _df_from_returns(btc_returns), _df_from_returns(alt_returns)
     )
 
 
-def test_beta_corr_and_selection():
-    btc_returns = np.random.normal(0, 0.01, 300)
-    alt_returns = btc_returns * 1.5 + np.random.normal(0, 0.002, 300)
-    btc_df = _df_from_returns(btc_returns)
-    alt_df = _df_from_returns(alt_returns)
+def test_beta_corr_and_selection(market: Market):
+    btc_returns, alt_returns, btc_df, alt_df = market
 
-    beta = compute_beta(pd.Series(alt_returns), pd.Series(btc_returns))
-    corr = compute_corr(pd.Series(alt_returns), pd.Series(btc_returns))
+    beta = compute_beta(alt_returns, btc_returns)
+    corr = compute_corr(alt_returns, btc_returns)
     assert beta > 1.0
     assert corr > 0.5
+    # Series take the same array path.
+    assert compute_beta_corr(pd.Series(alt_returns), pd.Series(btc_returns)) == (beta, corr)
+    batch = np.vstack([alt_returns, -btc_returns])
+    betas, corrs = _compute_betas_corrs_batch(_btc_stats(btc_returns), batch)
+    n = len(btc_returns)
+    assert betas.tolist() == pytest.approx([beta, -n / (n - 1)])
+    assert corrs.tolist() == pytest.approx([corr, -1.0])
 
     builder = UniverseBuilder(DummyExchange())
 
-    class Settings:
-        volume_percentile = 0.30
-        min_atr_pct = 0.0001
-        min_beta_btc = 1.0
-        min_corr_btc = 0.3
-        max_symbols = 1
-
-        class Weights:
-            volume = 0.5
-            atr_pct = 0.3
-            beta = 0.2
-
-        weights = Weights()
-        manual_override = []
-
+    settings = Settings(
+        volume_percentile=0.30,
+        min_atr_pct=0.0001,
+        min_beta_btc=1.0,
+        min_corr_btc=0.3,
+        max_symbols=1,
+        weights=Weights(volume=0.5, atr_pct=0.3, beta=0.2),
+        manual_override=(),
+    )
     result = builder.build(
         btc_df,
         {"ALT/USDT": alt_df},
         {"ALT/USDT": {"quoteVolume": 1_000_000}},
-        Settings(),
+        settings,
     )
     assert result.symbols == ["ALT/USDT"]
+
+
+def test_build_compares_short_history_over_trailing_overlap(market: Market):
+    btc_returns, alt_returns, btc_df, alt_df = market
+    # A recent listing has fewer candles than BTC.
+    new_df = alt_df.tail(101)
+
+    settings = Settings(
+        volume_percentile=1.0,
+        min_atr_pct=0.0001,
+        min_beta_btc=1.0,
+        min_corr_btc=0.3,
+        max_symbols=2,
+        weights=Weights(volume=0.5, atr_pct=0.3, beta=0.2),
+        manual_override=(),
+    )
+    result = UniverseBuilder(DummyExchange()).build(
+        btc_df,
+        {"ALT/USDT": alt_df, "NEW/USDT": new_df},
+        {"ALT/USDT": {"quoteVolume": 1_000_000}, "NEW/USDT": {"quoteVolume": 500_000}},
+        settings,
+    )
+    assert sorted(result.symbols) == ["ALT/USDT", "NEW/USDT"]
+    assert compute_beta(alt_returns[-100:], btc_returns[-100:]) > 1.0